@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from robot.api.deco import keyword, library
+
+from robotnl import CheckEngine, PythonExecutor
+from robotnl.clock import VirtualClock
+
+
+@library(scope='TEST')
+class plain_python:
+    """Check engine running plain Python keywords for a simulated elevator, in simulated time"""
+    def __init__(self):
+        self.messages = list()
+        self.clock = VirtualClock()
+        self.topFloor = 3
+        self.halted = False
+
+    @keyword("plain Python check engine")
+    def plain_python_check_engine(self, top_floor=3, halted=False):
+        self.topFloor = int(top_floor)
+        self.halted = halted
+        executor = PythonExecutor(keywords={'elevator floor': self.elevator_floor,
+                                            'elevator is halted': lambda: self.halted},
+                                  variables={'floor': 3},
+                                  output=self.messages.append)
+        return CheckEngine(executor, self.clock)
+
+    def elevator_floor(self):
+        """The elevator moves up one floor every 10 seconds, up to its top floor"""
+        return min(int(self.clock.time() // 10), self.topFloor)
+
+    @keyword("plain Python log")
+    def plain_python_log(self):
+        return "\n".join(self.messages)
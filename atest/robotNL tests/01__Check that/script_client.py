@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import socket
+import threading
+import time
+
+from robot.api.deco import keyword, library
+
+
+@library(scope='TEST')
+class script_client:
+    """Sends a keyword script over a socket to `Check interactive`, from a separate thread"""
+    def __init__(self):
+        self.received = None
+        self.thread = None
+
+    @keyword("free port")
+    def free_port(self):
+        with socket.create_server(('127.0.0.1', 0)) as server:
+            return server.getsockname()[1]
+
+    @keyword("send keyword script to port")
+    def send_keyword_script_to_port(self, port, *lines):
+        self.thread = threading.Thread(target=self._send, args=(int(port), lines), daemon=True)
+        self.thread.start()
+
+    @keyword("replies to keyword script")
+    def replies_to_keyword_script(self):
+        self.thread.join(timeout=10)
+        return self.received
+
+    def _send(self, port, lines):
+        deadline = time.time() + 10
+        while True:
+            try:
+                connection = socket.create_connection(('127.0.0.1', port))
+                break
+            except ConnectionRefusedError:
+                if time.time() > deadline:
+                    return
+                time.sleep(0.05)
+        with connection, connection.makefile('r', encoding='utf-8') as replies:
+            connection.sendall("".join(line + "\n" for line in lines).encode('utf-8'))
+            connection.shutdown(socket.SHUT_WR)
+            self.received = replies.read()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import time
+
+from robot.api.deco import keyword, library
+from robot.utils import timestr_to_secs
+from robotnl.clock import VirtualClock
+
+
+@library
+class timed_keywords:
+    def __init__(self):
+        self.expiry_time = None
+        self.evaluations = 0
+
+    @keyword("Start countdown")
+    def start_countdown(self, duration):
+        self.expiry_time = time.perf_counter() + timestr_to_secs(duration)
+        self.evaluations = 0
+
+    @keyword("countdown has expired")
+    def countdown_has_expired(self):
+        self.evaluations += 1
+        return time.perf_counter() >= self.expiry_time
+
+    @keyword("number of evaluations")
+    def number_of_evaluations(self):
+        return self.evaluations
+
+    @keyword("simulation clock")
+    def simulation_clock(self):
+        self.simulated_time = 0.0
+        return VirtualClock(advance=self._advance_simulation)
+
+    def _advance_simulation(self, seconds):
+        self.simulated_time += seconds
+
+    @keyword("simulated countdown of ${duration} has expired")
+    def simulated_countdown_has_expired(self, duration):
+        return self.simulated_time >= timestr_to_secs(duration)
+
+    @keyword("simulated deadline in ${duration}")
+    def simulated_deadline_in(self, duration):
+        self.simulated_time = 0.0
+        self.deadline = timestr_to_secs(duration)
+
+    @keyword("simulated deadline has passed")
+    def simulated_deadline_has_passed(self):
+        return self.simulated_time >= self.deadline
+
+    @keyword("simulated time")
+    def simulated_time_in_seconds(self):
+        return self.simulated_time
+
+    @keyword("toggle state")
+    def toggle_state(self):
+        self.state = not getattr(self, 'state', False)
+
+    @keyword("state is off")
+    def state_is_off(self):
+        return not getattr(self, 'state', False)
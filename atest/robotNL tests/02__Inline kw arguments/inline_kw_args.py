@@ -39,3 +39,11 @@ class inline_kw_args:
         if type(kwargs['number']) is not int:
             raise AssertionError("kwarg number must be an int")
         return kwargs['number']
+
+    @keyword(name="${n} dozen")
+    def dozen(self, n: int):
+        return n * 12
+
+    @keyword(name="${n}%")
+    def percentage(self, n: int):
+        return n / 100
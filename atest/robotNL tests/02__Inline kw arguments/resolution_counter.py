@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from robot.api.deco import keyword, library
+
+from robotnl.inline_keywords import keyword_index
+
+
+@library(scope='GLOBAL')
+class resolution_counter:
+    """
+    Counts how often robotnl resolves a text as keyword, for inline keywords and check plans alike.
+    Every resolution that is not served from cache starts with asking the keyword index.
+    """
+    def __init__(self):
+        self.resolutions = 0
+        might_be_keyword = keyword_index.might_be_keyword
+        def counted(text):
+            self.resolutions += 1
+            return might_be_keyword(text)
+        keyword_index.might_be_keyword = counted
+
+    @keyword("keyword resolutions")
+    def keyword_resolutions(self):
+        return self.resolutions
@@ -30,12 +30,22 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+
 from robot.api import TypeInfo
-from robot.libraries.BuiltIn import BuiltIn
 from robot.running.arguments import TypeConverter
 from robot.utils import is_list_like
 
 from .inline_keywords import keyword
+from .profiler import profiled, log
+
+BINARY_TYPES = (bytes, bytearray, memoryview)
 
 class CheckOperator:
     """
@@ -109,53 +119,99 @@ class CheckOperator:
         """
         return OperatorProxy("!=").basicOperator(lValue, rValue)
 
+    def deeply_equals(self, lValue, rValue):
+        """Checks whether nested data, like dictionaries and lists from a JSON document, on the left
+        and right side are equal in structure and content.
+
+        Dictionaries must have the same keys and lists the same number of items, in the same order.
+        The values in them are compared like `equals` does, so text is compared case insensitive or
+        converted to the type of the value it is compared with. Either side can also be given as
+        text, in JSON or as Python literal. When the check fails, the report lists the paths to the
+        first differences that were found.
+
+        Example:
+        | `Check that` | _elevator status_ | `deeply equals` | {"floor": 3, "doors": ["closed", "locked"]} |
+        """
+        lValue, rValue = _as_structure(lValue, rValue), _as_structure(rValue, lValue)
+        if next(_structural_differences(lValue, rValue), None) is None:
+            return True
+        return Mismatch(lambda: _describe_differences(lValue, rValue))
+
     ################################################################################################
     # Operators that work on text items str() or Unicode()
     def contains_text(self, baseString, subString):
         """Performs a case insensitive check whether the right side is a substring of the left side
 
+        Binary values (bytes, bytearray, memoryview) are searched in place, without copying. For
+        binary values case is ignored for ASCII letters only, and text is compared in its UTF-8
+        encoded form.
+
         Examples:
         | `Check that` | the time is now | `contains text` | me |
         | `Check that` | the time is now | `contains text` | ME |
         | `Check That` | Robotstraße | `contains text` | Strasse |
+        | `Check that` | _last received frame_ | `contains text` | ack |
         """
         try:
-            return self.contains_exact_text(baseString.casefold(), subString.casefold())
-        except:
+            if isinstance(baseString, BINARY_TYPES) or isinstance(subString, BINARY_TYPES):
+                return _binary_contains(baseString, subString, ignoreCase=True)
+            return self.contains_exact_text(_casefold(baseString), _casefold(subString))
+        except Exception as err:
+            log(f"Unable to compare as text: {err}", level='DEBUG')
             return False
 
     def contains_exact_text(self, baseString, subString):
         """Performs a case sensitive check whether the right side is a substring of the left side
 
+        Binary values (bytes, bytearray, memoryview) are searched in place, without copying. Text is
+        compared to binary values in its UTF-8 encoded form.
+
         Examples:
         | `Check that` | the time is now | `contains text` | me |
         | `Check That` | Robotstraße | `contains text` | straße |
         """
         try:
+            if isinstance(baseString, BINARY_TYPES) or isinstance(subString, BINARY_TYPES):
+                return _binary_contains(baseString, subString, ignoreCase=False)
             return subString in baseString
-        except:
+        except Exception as err:
+            log(f"Unable to compare as text: {err}", level='DEBUG')
             return False
 
     def matches_without_case_to(self, leftText, rightText):
         """Performs a case insensitive check whether the left and right side texts are equal
 
+        For binary values (bytes, bytearray, memoryview) case is ignored for ASCII letters only,
+        and text is compared in its UTF-8 encoded form.
+
         Examples:
         | `Check that` | the time is now | `matches without case to` | the time is now |
         | `Check that` | the time is now | `matches without case to` | THE TIME IS NOW |
         | `Check That` | Robotstraße | `matches without case to` | ROBOTstrasse |
         """
         try:
-            return self.matches_with_case_to(leftText.casefold(), rightText.casefold())
-        except:
+            if isinstance(leftText, BINARY_TYPES) or isinstance(rightText, BINARY_TYPES):
+                return _binary_matches(leftText, rightText, ignoreCase=True)
+            return self.matches_with_case_to(_casefold(leftText), _casefold(rightText))
+        except Exception as err:
+            log(f"Unable to compare as text: {err}", level='DEBUG')
             return False
 
     def matches_with_case_to(self, leftText, rightText):
         """Performs a case sensitive check whether the left and right side texts are equal
 
+        Text is compared to binary values (bytes, bytearray, memoryview) in its UTF-8 encoded form.
+
         Examples:
         | `Check that` | the time is now | `matches with case to` | the time is now |
         | `Check That` | Robotstraße | `matches with case to` | Robotstraße |
         """
+        if isinstance(leftText, BINARY_TYPES) or isinstance(rightText, BINARY_TYPES):
+            try:
+                return _binary_matches(leftText, rightText, ignoreCase=False)
+            except Exception as err:
+                log(f"Unable to compare as text: {err}", level='DEBUG')
+                return False
         return leftText == rightText
 
     def does_not_contain_text(self, baseString, subString):
@@ -192,6 +248,157 @@ class CheckOperator:
         """
         return not self.matches_with_case_to(leftText, rightText)
 
+    def matches_pattern(self, text, pattern):
+        """Performs a case insensitive check whether the left side text fully matches the regular
+        expression on the right side
+
+        Uses Python's regular expression syntax. Case is ignored using simple case matching, i.e.
+        without expanding characters like ß to ss. For binary values (bytes, bytearray, memoryview)
+        case is ignored for ASCII letters only, and the pattern is matched in its UTF-8 encoded form.
+
+        Examples:
+        | `Check that` | Floor 12 | `matches pattern` | floor [0-9]+ |
+        | `Check that` | _elevator status_ | `matches pattern` | (idle\\|moving) |
+        """
+        return _pattern_search(text, pattern, ignoreCase=True, fullMatch=True)
+
+    def matches_exact_pattern(self, text, pattern):
+        """Performs a case sensitive check whether the left side text fully matches the regular
+        expression on the right side
+
+        Examples:
+        | `Check that` | Floor 12 | `matches exact pattern` | Floor [0-9]+ |
+        """
+        return _pattern_search(text, pattern, ignoreCase=False, fullMatch=True)
+
+    def does_not_match_pattern(self, text, pattern):
+        """Performs a case insensitive check whether the left side text does not fully match the
+        regular expression on the right side
+
+        Example:
+        | `Check that` | Floor 12 | `does not match pattern` | floor [0-9] |
+        """
+        return not self.matches_pattern(text, pattern)
+
+    def does_not_match_exact_pattern(self, text, pattern):
+        """Performs a case sensitive check whether the left side text does not fully match the
+        regular expression on the right side
+
+        Example:
+        | `Check that` | Floor 12 | `does not match exact pattern` | floor [0-9]+ |
+        """
+        return not self.matches_exact_pattern(text, pattern)
+
+    def contains_match_for(self, text, pattern):
+        """Performs a case insensitive check whether any part of the left side text matches the
+        regular expression on the right side
+
+        Large texts and binary values are searched in place, without copying. See `Matches
+        pattern` for details on ignoring case.
+
+        Examples:
+        | `Check that` | Arrived at floor 12 | `contains match for` | floor [0-9]+ |
+        | `Check that` | _last received frame_ | `contains match for` | ack\\|nack |
+        """
+        return _pattern_search(text, pattern, ignoreCase=True, fullMatch=False)
+
+    def contains_exact_match_for(self, text, pattern):
+        """Performs a case sensitive check whether any part of the left side text matches the
+        regular expression on the right side
+
+        Example:
+        | `Check that` | Arrived at floor 12 | `contains exact match for` | floor [0-9]+ |
+        """
+        return _pattern_search(text, pattern, ignoreCase=False, fullMatch=False)
+
+    def does_not_contain_match_for(self, text, pattern):
+        """Performs a case insensitive check whether no part of the left side text matches the
+        regular expression on the right side
+
+        Example:
+        | `Check that` | Arrived at floor 12 | `does not contain match for` | error |
+        """
+        return not self.contains_match_for(text, pattern)
+
+    ################################################################################################
+    # Operators that work on the content of files. Files are memory mapped instead of read, so
+    # that large files can be checked without loading them into memory. Text is searched for in
+    # its UTF-8 encoded form. A file that does not exist (yet) does not satisfy the check.
+    def file_contains_text(self, path, text):
+        """Performs a case insensitive check whether the file at the left side contains the text on
+        the right side. Case is ignored for ASCII letters only.
+
+        Example:
+        | `Check that` | ${OUTPUT DIR}/device.log | `file contains text` | boot complete |
+        """
+        with _mapped_file(path) as content:
+            return content is not None and \
+                   _binary_pattern(_as_bytes(text), True).search(content) is not None
+
+    def file_contains_exact_text(self, path, text):
+        """Performs a case sensitive check whether the file at the left side contains the text on
+        the right side.
+
+        Example:
+        | `Check that` | ${OUTPUT DIR}/device.log | `file contains exact text` | Boot complete |
+        """
+        with _mapped_file(path) as content:
+            return content is not None and content.find(_as_bytes(text)) != -1
+
+    def file_contains_line_matching(self, path, pattern):
+        """Checks whether the file at the left side contains a line that fully matches the regular
+        expression on the right side. Line endings are not part of the line.
+
+        Example:
+        | `Check that` | ${OUTPUT DIR}/device.log | `file contains line matching` | Floor [0-9]+ reached |
+        """
+        with _mapped_file(path) as content:
+            return content is not None and \
+                   _line_pattern(_as_bytes(pattern)).search(content) is not None
+
+    def file_grows_to_contain(self, path, text):
+        """Performs a case insensitive check whether the file at the left side contains the text on
+        the right side, for files that are only appended to, like log files. Case is ignored for
+        ASCII letters only.
+
+        This operator is intended for use with a time constraint. The first evaluation of a check
+        searches the whole file, including what was written before the check started. Repeated
+        evaluations of the same check only search the part of the file that was appended since
+        the previous evaluation. When the file is replaced or truncated, it is searched from the
+        start. A file that does not exist yet does not contain the text.
+
+        Example:
+        | `Check that` | ${OUTPUT DIR}/elevator.log | `file grows to contain` | self test passed | within | 2 minutes |
+        """
+        sub = _as_bytes(text)
+        key = (os.path.abspath(path), sub)
+        scannedFiles = _scanned_files.get()
+        if scannedFiles is None:
+            scannedFiles = dict() # Not evaluated as part of a check. Nothing to remember.
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError as err:
+            log(f"File not found: {err}", level='DEBUG')
+            scannedFiles.pop(key, None)
+            return False
+        with f:
+            stat = os.fstat(f.fileno())
+            fileId = (stat.st_dev, stat.st_ino)
+            scannedId, scannedSize = scannedFiles.get(key, (None, 0))
+            if scannedId != fileId or stat.st_size < scannedSize:
+                scannedSize = 0 # New or truncated file
+            # Start a bit before the end of the previous scan to include text split over both parts
+            start = max(scannedSize - len(sub) + 1, 0)
+            if stat.st_size > start:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    found = _binary_pattern(sub, True).search(content, start) is not None
+                log(f"Searched {stat.st_size - start} bytes from offset {start}")
+                if found:
+                    scannedFiles.pop(key, None)
+                    return True
+            scannedFiles[key] = (fileId, stat.st_size)
+            return False
+
     ################################################################################################
     # Operators that work on lists or other sequences
     def is_empty(self, sequence):
@@ -218,7 +425,7 @@ class CheckOperator:
         _Assumes a 'suitcase' type to be defined with associated action and observation keywords._
         """
         count = len(sequence)
-        BuiltIn().log(f"Counted {count} items")
+        log(f"Counted {count} items")
         return count == n
 
     def contains_1_item(self, sequence):
@@ -267,14 +474,14 @@ class CheckOperator:
         if not is_list_like(part):
             part = [part]
         for elem in part:
-            BuiltIn().log(f"Processing '{elem}' from right side")
+            log(f"Processing '{elem}' from right side")
             for item in sequence:
                 if self.equals(elem, item):
-                    BuiltIn().log("Matched")
+                    log("Matched")
                     break
-                BuiltIn().log("No match")
+                log("No match")
             else:
-                BuiltIn().log(f"{elem} not present in left side list")
+                log(f"{elem} not present in left side list")
                 return False
         return True
 
@@ -301,16 +508,16 @@ class CheckOperator:
             sequence_right = [sequence_right]
         sequence_right = [*sequence_right]
         for item in sequence:
-            BuiltIn().log(f"Processing '{item}' from left side list")
+            log(f"Processing '{item}' from left side list")
             for i in range(len(sequence_right)):
                 if self.equals(item, sequence_right[i]):
                     sequence_right.pop(i)
                     break
             else:
-                BuiltIn().log(f"Item '{item}' from left side is not found in the list on the right side")
+                log(f"Item '{item}' from left side is not found in the list on the right side")
                 return False
         if len(sequence_right) > 0:
-            BuiltIn().log(f"Not all items from right side list are present: {sequence_right}")
+            log(f"Not all items from right side list are present: {sequence_right}")
             return False
 
         return True
@@ -334,6 +541,72 @@ class CheckOperator:
             raise TypeError("List-like items not accepted as right side value")
         return not self.contains_item(sequence, part)
 
+    def is_subset_of(self, sequence, sequence_right):
+        """Checks whether all items of the sequence on the left side are present in the sequence
+        on the right side.
+
+        Items are compared as by `equals`, applying automatic Robot type conversion and case
+        insensitive text comparison. Unlike `contains items`, items are looked up by hashing, so
+        the check remains fast for large sequences. When the check fails, a sample of the missing
+        items is logged.
+
+        Example:
+        | `Check that` | ${received ids} | `is subset of` | ${expected ids} |
+        | `Check that` | suitcase | `is subset of` | toothbrush | t-shirt | towel |
+        _Assumes a 'suitcase' type to be defined with associated action and observation keywords._
+        """
+        index = ItemIndex(_as_items(sequence_right))
+        missing = [item for item in _as_items(sequence) if item not in index]
+        if missing:
+            _log_sample("Items from left side not present in right side", missing)
+        return not missing
+
+    def is_superset_of(self, sequence, sequence_right):
+        """Checks whether all items of the sequence on the right side are present in the sequence
+        on the left side.
+
+        Items are compared as by `equals`. See `is subset of` for details.
+
+        Example:
+        | `Check that` | suitcase | `is superset of` | toothbrush | t-shirt |
+        _Assumes a 'suitcase' type to be defined with associated action and observation keywords._
+        """
+        return self.is_subset_of(sequence_right, sequence)
+
+    def has_no_items_in_common_with(self, sequence, sequence_right):
+        """Checks whether none of the items of the sequence on the left side is present in the
+        sequence on the right side.
+
+        Items are compared as by `equals`. See `is subset of` for details.
+
+        Example:
+        | `Check that` | ${first batch ids} | `has no items in common with` | ${second batch ids} |
+        """
+        index = ItemIndex(_as_items(sequence_right))
+        common = [item for item in _as_items(sequence) if item in index]
+        if common:
+            _log_sample("Items from left side also present in right side", common)
+        return not common
+
+    def has_no_duplicates(self, sequence):
+        """Checks whether each item in the sequence on the left occurs only once.
+
+        Items are compared as by `equals`. See `is subset of` for details.
+
+        Example:
+        | `Check that` | ${assigned ids} | `has no duplicates` |
+        """
+        index = ItemIndex()
+        duplicates = list()
+        for item in _as_items(sequence):
+            if item in index:
+                duplicates.append(item)
+            else:
+                index.add(item)
+        if duplicates:
+            _log_sample("Duplicate items", duplicates)
+        return not duplicates
+
 # Add operator keywords that do not comply to Python's identifier syntax
 setattr(CheckOperator, "=", CheckOperator.equals)
 setattr(CheckOperator, "<", CheckOperator.is_less_than)
@@ -342,6 +615,302 @@ setattr(CheckOperator, "≤", CheckOperator.is_less_than_or_equal_to)
 setattr(CheckOperator, "≥", CheckOperator.is_greater_than_or_equal_to)
 setattr(CheckOperator, "≠", CheckOperator.does_not_equal)
 
+# Checks are often polled, comparing the same text over and over again. Looking up the case folded
+# form of a text that was seen before is cheaper than folding it again. Only short texts are
+# cached, so that the cache does not keep large texts, like log files, alive.
+CASEFOLD_CACHE_LIMIT = 1000 # characters
+_cached_casefold = lru_cache(maxsize=32)(str.casefold)
+
+def _casefold(text):
+    return _cached_casefold(text) if len(text) <= CASEFOLD_CACHE_LIMIT else text.casefold()
+
+def _binary_view(value):
+    """Returns a byte oriented view on a binary value, without copying its content"""
+    view = memoryview(value)
+    return view if view.format == 'B' else view.cast('B')
+
+def _as_bytes(value):
+    """For small operands only. Text is encoded, binary values are copied."""
+    return value.encode('utf-8') if isinstance(value, str) else bytes(value)
+
+@lru_cache(maxsize=256)
+def _compiled_pattern(pattern, flags=0):
+    """Bounded cache of compiled regular expressions, keyed by pattern and flags"""
+    return re.compile(pattern, flags)
+
+def _binary_pattern(subBytes, ignoreCase):
+    # Regular expressions on bytes ignore case for ASCII letters only
+    return _compiled_pattern(re.escape(subBytes), re.IGNORECASE if ignoreCase else 0)
+
+def _line_pattern(patternBytes):
+    return _compiled_pattern(rb'^(?:' + patternBytes + rb')\r?$', re.MULTILINE)
+
+def _pattern_search(text, pattern, ignoreCase, fullMatch):
+    if isinstance(text, BINARY_TYPES):
+        text = _binary_view(text)
+        pattern = _as_bytes(pattern)
+    elif isinstance(pattern, BINARY_TYPES):
+        pattern = bytes(pattern).decode('utf-8')
+    regex = _compiled_pattern(pattern, re.IGNORECASE if ignoreCase else 0)
+    try:
+        match = regex.fullmatch(text) if fullMatch else regex.search(text)
+    except TypeError as err:
+        log(f"Unable to match as text: {err}", level='DEBUG')
+        return False
+    return match is not None
+
+@contextmanager
+def _mapped_file(path):
+    """Yields the content of the file at path, or None if there is no such file"""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError as err:
+        log(f"File not found: {err}", level='DEBUG')
+        yield None
+        return
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b'' # Empty files cannot be mapped
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                yield content
+
+# Identity and size of files as far as they were already searched by `file grows to contain`,
+# during the check that is running. See file_scans.
+_scanned_files = ContextVar('robotnl_scanned_files', default=None)
+
+@contextmanager
+def file_scans():
+    """
+    Lets `file grows to contain` remember how far it searched files for as long as the context
+    lasts, which is for the duration of a single check.
+    """
+    token = _scanned_files.set(dict())
+    try:
+        yield
+    finally:
+        _scanned_files.reset(token)
+
+def _binary_contains(base, sub, ignoreCase):
+    if isinstance(base, str):
+        # Only the substring is binary. It is small enough to decode.
+        sub = bytes(sub).decode('utf-8')
+        return _casefold(sub) in _casefold(base) if ignoreCase else sub in base
+    sub = _as_bytes(sub)
+    if not ignoreCase and not isinstance(base, memoryview):
+        return sub in base
+    return _binary_pattern(sub, ignoreCase).search(_binary_view(base)) is not None
+
+def _binary_matches(left, right, ignoreCase, chunkSize=1 << 16):
+    left = _binary_view(left.encode('utf-8') if isinstance(left, str) else left)
+    right = _binary_view(right.encode('utf-8') if isinstance(right, str) else right)
+    if len(left) != len(right):
+        return False
+    if not ignoreCase:
+        return left == right
+    # Compare in chunks to keep memory use bounded for large buffers
+    for i in range(0, len(left), chunkSize):
+        if left[i:i+chunkSize].tobytes().lower() != right[i:i+chunkSize].tobytes().lower():
+            return False
+    return True
+
+def _as_items(value):
+    return value if is_list_like(value) else [value]
+
+def _log_sample(message, items, sampleSize=10):
+    sample = ", ".join([f"'{item}'" for item in items[:sampleSize]])
+    if len(items) > sampleSize:
+        sample += ", ..."
+    log(f"{message} ({len(items)}): {sample}")
+
+@lru_cache(maxsize=None)
+def _converter_for(type_):
+    return TypeConverter.converter_for(TypeInfo.from_type(type_))
+
+_NOT_CONVERTED = object()
+
+@profiled("operator conversion")
+def _convert_text(text, type_):
+    converter = _converter_for(type_)
+    if converter is None:
+        return _NOT_CONVERTED
+    try:
+        return converter.convert(text, None)
+    except ValueError:
+        return _NOT_CONVERTED
+
+MAX_DIFFERENCES = 10 # Number of differences reported when nested data is not equal
+
+class Mismatch:
+    """
+    Negative outcome of an operator that can explain why it is negative. The explanation is only
+    worked out when requested, which normally happens once, when the check finally fails.
+    """
+    def __init__(self, explain):
+        self.__explain = explain
+
+    def __bool__(self):
+        return False
+
+    def __str__(self):
+        return "False"
+
+    __repr__ = __str__
+
+    def explain(self):
+        return self.__explain()
+
+def _values_equal(left, right):
+    """Compares two values the way `equals` does, but without logging"""
+    if type(left) is str and type(right) is str:
+        return left.casefold() == right.casefold()
+    if type(left) is str or type(right) is str:
+        text, other = (left, right) if type(left) is str else (right, left)
+        value = _convert_text(text, type(other))
+        if value is _NOT_CONVERTED:
+            return False
+        return value == other
+    return left == right
+
+def _is_sequence(value):
+    return isinstance(value, (list, tuple))
+
+def _as_structure(value, other):
+    """Parses value when it is text describing nested data to compare with other"""
+    if type(value) is not str or not isinstance(other, (dict, list, tuple)):
+        return value
+    converted = _convert_text(value, type(other))
+    if converted is not _NOT_CONVERTED:
+        return converted
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+def _dict_pairs(path, left, right):
+    return (((path, key), value, right[key]) for key, value in left.items() if key in right)
+
+def _sequence_pairs(path, left, right):
+    return (((path, i), l, r) for i, (l, r) in enumerate(zip(left, right)))
+
+def _structural_differences(left, right):
+    """
+    Yields the differences between two nested data structures as (path, description) pairs, in
+    document order. The structures are walked in place and only as far as the caller consumes
+    the differences. Paths are kept as linked (parent, key) pairs until a difference is found.
+    """
+    pending = [iter([(None, left, right)])]
+    while pending:
+        pair = next(pending[-1], None)
+        if pair is None:
+            pending.pop()
+            continue
+        path, l, r = pair
+        if l is r:
+            continue
+        if isinstance(l, dict) and isinstance(r, dict):
+            if type(l) is type(r) and l == r:
+                continue
+            for key in l:
+                if key not in r:
+                    yield _path_text((path, key)), "is missing on the right side"
+            for key in r:
+                if key not in l:
+                    yield _path_text((path, key)), "is missing on the left side"
+            pending.append(_dict_pairs(path, l, r))
+        elif _is_sequence(l) and _is_sequence(r):
+            if type(l) is type(r) and l == r:
+                continue
+            if len(l) != len(r):
+                yield _path_text(path), f"has {len(l)} items on the left and {len(r)} on the right"
+            pending.append(_sequence_pairs(path, l, r))
+        elif not _values_equal(l, r):
+            yield _path_text(path), f"{_short_repr(l)} ≠ {_short_repr(r)}"
+
+def _path_text(path):
+    keys = list()
+    while path is not None:
+        path, key = path
+        keys.append(f"[{key!r}]")
+    return "$" + "".join(reversed(keys))
+
+def _short_repr(value, maxLength=40):
+    text = repr(value)
+    return text if len(text) <= maxLength else text[:maxLength-3] + "..."
+
+def _describe_differences(left, right):
+    differences = list()
+    for path, description in _structural_differences(left, right):
+        if len(differences) == MAX_DIFFERENCES:
+            differences.append("...")
+            break
+        differences.append(f"  {path} {description}")
+    return "Differences:\n" + "\n".join(differences)
+
+class ItemIndex:
+    """
+    Hash based index for looking up items the way `equals` compares them. Text is compared case
+    insensitive, or converted to the type of the item it is compared with. Items that cannot be
+    hashed are compared one by one.
+    """
+    def __init__(self, items=()):
+        self.__values = dict()         # Hashable items that are not text
+        self.__types = set()           # Types of those items
+        self.__texts = dict()          # Case folded text
+        self.__convertedTexts = dict() # Per type: text items converted to that type
+        self.__unhashable = list()
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        if isinstance(item, str):
+            self.__texts.setdefault(item.casefold(), item)
+            for type_, converted in self.__convertedTexts.items():
+                self.__add_converted(converted, type_, item)
+            return
+        try:
+            self.__values.setdefault(item, item)
+            self.__types.add(type(item))
+        except TypeError:
+            self.__unhashable.append(item)
+
+    @staticmethod
+    def __add_converted(converted, type_, text):
+        value = _convert_text(text, type_)
+        if value is not _NOT_CONVERTED:
+            try:
+                converted.setdefault(value, text)
+            except TypeError:
+                pass
+
+    def __converted(self, type_):
+        if type_ not in self.__convertedTexts:
+            self.__convertedTexts[type_] = dict()
+            for text in self.__texts.values():
+                self.__add_converted(self.__convertedTexts[type_], type_, text)
+        return self.__convertedTexts[type_]
+
+    def __contains__(self, item):
+        if isinstance(item, str):
+            if item.casefold() in self.__texts:
+                return True
+            for type_ in self.__types:
+                value = _convert_text(item, type_)
+                try:
+                    if value is not _NOT_CONVERTED and value in self.__values:
+                        return True
+                except TypeError:
+                    pass
+        else:
+            try:
+                if item in self.__values or item in self.__converted(type(item)):
+                    return True
+            except TypeError:
+                # Unhashable items can only be compared one by one
+                return any(OperatorProxy("==").basicOperator(item, other) for other in
+                           [*self.__values, *self.__texts.values(), *self.__unhashable])
+        return any(OperatorProxy("==").basicOperator(item, other) for other in self.__unhashable)
+
 class OperatorProxy:
     """
     Proxy class for mapping generic Robot comparison keywords to Python operators
@@ -350,6 +919,7 @@ class OperatorProxy:
         self.__s_Operator = s_operator
 
     @staticmethod
+    @profiled("operator conversion")
     def __typeCastRobotStringValue(leadingValue, otherValue, name):
         """
         When Robot files are parsed, arguments are always passed as string even when comparing
@@ -367,12 +937,12 @@ class OperatorProxy:
             try:
                 CastedOther = converter.convert(otherValue, name)
             except ValueError as err:
-                BuiltIn().log(err, level='DEBUG')
-            BuiltIn().log(f"Comparing as {converter.type_name} values")
+                log(err, level='DEBUG')
+            log(f"Comparing as {converter.type_name} values")
 
         if isinstance(CastedOther, str):
             # By default compare as case insensitive Unicode. Note that it already was a string.
-            BuiltIn().log(f"Interpreting {name} '{otherValue}' as string (case insensitive)")
+            log(f"Interpreting {name} '{otherValue}' as string (case insensitive)")
             CastedOther = str(otherValue).casefold()
 
         return CastedOther
@@ -389,6 +959,6 @@ class OperatorProxy:
             rValue = OperatorProxy.__typeCastRobotStringValue(lvalue, rvalue, "right operand")
 
         if lValue is lvalue and rValue is rvalue:
-            BuiltIn().log("Comparing values as is")
+            log("Comparing values as is")
 
         return eval(f"lValue {self.__s_Operator} rValue")
@@ -30,7 +30,6 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import time
 try:
     import tkinter
     from tkinter import messagebox, simpledialog
@@ -40,15 +39,22 @@ except ImportError:
 from robot.libraries.BuiltIn import BuiltIn
 from robot.running import RUN_KW_REGISTER
 from robot.utils import timestr_to_secs, secs_to_timestr
-from .inline_keywords import is_keyword
+from .check_engine import CheckEngine, CheckFailed, RobotExecutor
+from .clock import RealTimeClock
+from .interactive import KeywordScript, run_script_from, split_keyword_line, COMPLETION_PREFIX
+from .sampling import SharedSamples
+from .timing_profile import TimingProfile
+from .watchdog import Watchdogs
 
-class CheckFailed(RuntimeError):
-    ROBOT_CONTINUE_ON_FAILURE = True
 
 class RobotChecks:
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     def __init__(self):
         self.__gui = None
+        self.__engine = CheckEngine(RobotExecutor())
+        self.__watchdogs = Watchdogs(self.__engine.evaluate_invariant,
+                                     lambda: self.__engine.clock.time())
+        self.ROBOT_LIBRARY_LISTENER = self.__watchdogs
 
     @property
     def _gui(self):
@@ -74,7 +80,7 @@ class RobotChecks:
         point where it was able to check the requirement it was testing for.
         """
         try:
-            return RobotChecks.__execute_check("Precondition", *args)
+            return self.__engine.execute_check("Precondition", args)
         except CheckFailed as failure:
             failure.ROBOT_CONTINUE_ON_FAILURE = False
             raise failure
@@ -91,7 +97,7 @@ class RobotChecks:
         the cause of failure.
         """
         try:
-            return RobotChecks.__execute_check("Postcondition", *args)
+            return self.__engine.execute_check("Postcondition", args)
         except CheckFailed as failure:
             failure.ROBOT_CONTINUE_ON_FAILURE = False
             raise failure
@@ -137,10 +143,58 @@ class RobotChecks:
         | _Request elevator at floor_ | 3 |
         | `Check that` | _elevator floor_ | `equals` | 3 | within | 20 seconds |
         | `Check that` | _offset to floor level in mm_ | `≤` | 5 | within | 3 seconds |
+
+        *Checking that conditions remain true*:\n
+                Using ``during`` or ``remains for`` instead of ``within`` checks that the condition
+                stays true for the specified time. The condition is sampled at a steady rate and
+                the test case fails on the first sample that is false. A compact timeline of the
+                samples is logged instead of every evaluation.
+
+        Example with sustained condition:
+        | `Check that` | _elevator doors are closed_ | remains for | 30 seconds |
+
+        *Adding guard conditions*:\n
+                A check can be given a guard condition by adding ``unless`` or ``fail if``,
+                followed by a condition in the same form as the check itself. Each time the check
+                is evaluated and found false, the guard condition is evaluated as well. As soon
+                as the guard condition is true, the check fails without waiting for the remainder
+                of its time constraint.
+
+        Example with guard condition:
+        | `Check that` | _elevator floor_ | `equals` | 3 | unless | _elevator is halted_ | within | 20 seconds |
+
+        *Reserved words*:\n
+                ``within``, ``during``, ``remains for``, ``unless`` and ``fail if`` are reserved
+                words in checks, regardless of case. To use one of them as a value, precede it
+                with a backslash.
+
+        Example with reserved word as value:
+        | `Check that` | _elevator mode_ | `equals` | \\unless |
         """
-        return RobotChecks.__execute_check("Requirement", *args)
+        return self.__engine.execute_check("Requirement", args)
     RUN_KW_REGISTER.register_run_keyword('robotnl', check_that.__name__, args_to_process=0, deprecation_warning=False)
 
+    def check_that_for_each(self, rows, *args):
+        """
+        Checks a requirement for each row of a table, in a single step.
+
+        ``rows`` is a list of rows, for example a list of dictionaries. The check that follows is
+        given in the same form as for `Check that` and is evaluated once for each row, with the
+        current row available as ``${row}``. The check is parsed once, and keywords and operators
+        are looked up once, for all rows. Apart from the assignment of ``${row}``, the evaluation
+        of individual rows is not logged. A single report lists the rows that failed, if any.
+        Operators are run the same way as for `Check that`, see `Use direct operator calls`.
+
+        Time constraints and guard conditions cannot be used here. Afterwards ``${row}`` has its
+        previous value, or the value of the last row if it was not set before.
+
+        Example:
+        | `Check that for each` | ${orders} | ${row}[total] | `equals` | _Order total_ | ${row}[id] |
+        | `Check that for each` | ${readings} | ${row.actual} | `≤` | ${row.limit} |
+        """
+        return self.__engine.execute_table_check("Requirement", rows, args)
+    RUN_KW_REGISTER.register_run_keyword('robotnl', check_that_for_each.__name__, args_to_process=1, deprecation_warning=False)
+
     def check_manual(self, checkRequestText=""):
         """
         Suspends test execution to perform a manual or visual check.
@@ -177,182 +231,236 @@ class RobotChecks:
                 keys = input().lower()
                 return 'pass' if keys == 'y' or keys == 'yes' else 'fail'
 
-    def check_interactive(self):
+    def check_interactive(self, source=None, timeout='5 minutes'):
         """
         Suspends test execution to accept manual input of keywords.
 
         A single ``Check interactive`` will repeatedly accept keyword input. Errors from keywords will
         not stop the test case, instead test execution continues until 'Cancel' is clicked or 'exit' is entered.
-        There is no timeout. Test execution is suspended indefinitely.
+        While prompting there is no timeout. Test execution is suspended indefinitely.
+
+        Entering ``?`` followed by the start of a keyword name lists the matching keywords. Ending the
+        input with ``...`` continues the arguments of the keyword in the next input, which may start
+        with ``...`` as well. The keyword runs when its last input is entered.
+
+        When a ``source`` is given, keywords are read from that source as a script instead of
+        being prompted for one at a time. The outcome of each keyword is reported as soon as it
+        is done. Source can be:
+        - ``stdin`` to read the script from standard input, until end of input
+        - ``localhost:<port>`` to accept a single connection on the local port. Lines are run as
+          they arrive and their outcome is sent back, until the connection closes. The keyword
+          fails if no connection is made within ``timeout``.
+        - the path of a file containing the script
+
+        Scripts use the same format as the interactive input, one keyword per line. Lines starting
+        with ``...`` continue the arguments of the previous line, so a keyword runs when the next
+        line arrives. A blank line runs it right away. Lines starting with ``#`` are ignored and an
+        exit command ends the script.
+
+        Example:
+        | `Check interactive` | ${CURDIR}/explore_elevator.txt |
+        | `Check interactive` | localhost:8270 |
         """
-        exit = False
-        exit_commands = {"exit", "quit", "stop", "e", "x", "q"}
+        if source:
+            run_script_from(source, BuiltIn().log_to_console, timestr_to_secs(timeout))
+            return
+
         prompt = "Enter a keyword. Arguments can be separated using multi-space."\
-                 " Type 'exit' or a blank keyword to exit interactive mode."
-        while not exit:
+                 " End with '...' to continue the arguments in the next input."\
+                 " Type 'exit' or a blank keyword to exit interactive mode."\
+                 f" Type '{COMPLETION_PREFIX}' and the start of a keyword name to list keywords."
+        script = KeywordScript(BuiltIn().log_to_console)
+        continued = False # The previous input ended with '...'
+        while not script.exited:
             if self._gui:
                 newInput = simpledialog.askstring("Interactive keyword mode", prompt)
             else:
                 BuiltIn().log_to_console('\n'+prompt)
                 newInput = input()
-            if not newInput or newInput.lower() in exit_commands:
-                exit = True
-            elif len(newInput) != 0:
-                BuiltIn().log_to_console("Interactive input: " + newInput)
-                newInputSplit = list(filter(None, [s.strip() for s in newInput.replace('\t', '  ').split('  ')])) # Splits on double space, removes additional whitespace, then filters out empty elements
-                # Unlike when "Run Keyword" is used in a .robot file, in "run_keyword()" the keyword must be explicitly split off from the arguments
-                newKeyword = newInputSplit[0]
-                newArgs = newInputSplit[1:]
-                try:
-                    return_value = BuiltIn().run_keyword(newKeyword, *newArgs)
-                    if return_value is not None:
-                        BuiltIn().log_to_console(return_value)
-                except Exception as e:
-                    BuiltIn().log_to_console("Error in interactive keyword '%s'\n\n%s" % (newInput, e))
-
-    @staticmethod
-    def __execute_check(checkType, *args):
+            if not newInput or not newInput.strip():
+                break
+            BuiltIn().log_to_console("Interactive input: " + newInput)
+            # Unlike when "Run Keyword" is used in a .robot file, in "run_keyword()" the keyword
+            # must be explicitly split off from the arguments. The script takes care of that.
+            cells = split_keyword_line(newInput)
+            continues = len(cells) > 1 and cells[-1] == '...'
+            if continues:
+                cells = cells[:-1]
+            if continued and cells[0] != '...':
+                cells.insert(0, '...')
+            script.feed("    ".join(cells))
+            if not continues:
+                script.flush()
+            continued = continues
+
+    def start_watchdog(self, name, *args):
         """
-        Parse arguments for check keyword to determine its operands, evaluate them and execute the
-        check.
+        Starts monitoring a condition in the background, while the test continues.
+
+        The condition is given in the same form as for `Check that`, optionally followed by
+        ``every`` and the time between samples, 1 second by default. The condition is sampled
+        directly at the start and then whenever a keyword ends and the next sample is due. Samples
+        that are not true are recorded as violations. Keywords that take longer than the time
+        between samples delay the next sample until they end.
+
+        Violations fail the test in which they were found. A watchdog started in a test stops
+        when that test ends. A watchdog started in a suite setup keeps running until it is
+        stopped using `Stop watchdog` or until that suite ends.
+
+        Example:
+        | `Start watchdog` | doors | _elevator doors are closed_ | unless | _elevator is halted_ | every | 100 ms |
+        | _Request elevator at floor_ | 3 |
+        | `Check that` | _elevator floor_ | `equals` | 3 | within | 20 seconds |
+        | `Stop watchdog` | doors |
         """
         Arguments = list(args)
-
-        ############################################################################################
-        # check for time argument
-        TimeOutInSeconds = 0
-        TimeRemaining = True
-        s_TimeConstraint = ""
-        if len(Arguments) >= 2 and str(Arguments[-2]).lower() == 'within':
-            EvaluatedTimeArg = RobotChecks.__evaluateOperand([Arguments[-1]])[0]
-            TimeOutInSeconds = timestr_to_secs(EvaluatedTimeArg)
-            s_TimeConstraint = Arguments[-1]
+        Interval = 1.0
+        if len(Arguments) >= 2 and str(Arguments[-2]).lower() == 'every':
+            Interval = timestr_to_secs(BuiltIn().replace_variables(Arguments[-1]))
             Arguments = Arguments[:-2]
+        Plan = self.__engine.plan("Watchdog", Arguments)
+        if Plan.timeConstraint:
+            BuiltIn().fail("Watchdogs cannot have a time constraint, use 'every' to set the time "
+                           "between samples")
+        BuiltIn().log(f"Starting watchdog '{name}' on {Plan.expression()} every "
+                      f"{secs_to_timestr(Interval)}")
+        self.__watchdogs.start(name, Plan, Interval)
+    RUN_KW_REGISTER.register_run_keyword('robotnl', start_watchdog.__name__, args_to_process=1, deprecation_warning=False)
+
+    def stop_watchdog(self, name):
+        """
+        Stops the watchdog started using `Start watchdog` and takes a last sample. Fails if any
+        violations were found that were not already reported to an earlier test.
+        """
+        Watchdog = self.__watchdogs.stop(name)
+        NewViolations = Watchdog.new_violations()
+        if NewViolations:
+            raise CheckFailed(Watchdog.report(NewViolations))
+        BuiltIn().log(f"Watchdog '{name}' found no violations in {Watchdog.samples} samples")
 
-        if not len(Arguments):
-            BuiltIn().fail("%s check failed. There was nothing to check." % checkType)
-
-        ############################################################################################
-        # Build expression
-        LeftOperand = list()
-        OperatorKeyword = None
-        RightOperand = list()
-
-        # Single argument or the first argument is a keyword AND No other arguments are keywords
-        if len(Arguments) == 1 or \
-           is_keyword(Arguments[0]) and not list(filter(is_keyword, Arguments[1:])):
-            # Interpret as single boolean expression
-            LeftOperand = Arguments
-
-        else: # Interpret as expression
-            LeftOperand.append(Arguments.pop(0))
-
-            NextArgument = Arguments.pop(0)
-            while not is_keyword(NextArgument):
-                LeftOperand.append(NextArgument)
-
-                # Prepare next loop
-                if not len(Arguments):
-                    BuiltIn().fail("Missing operator in check keyword")
-                NextArgument = Arguments.pop(0)
-
-            OperatorKeyword = NextArgument
-            RightOperand = list(Arguments)
-
-        ###########################################################################################
-        # Evaluate expression
-        EvaluatedResult = None
-
-        StartTime = time.perf_counter()
-        TimeLeft = TimeOutInSeconds
-        PollMax = 20 # After 20s people start wondering: "Is it still going?" Time for an update.
-        PollMin = min(PollMax/8, TimeOutInSeconds*3/100) # Shortest delay is 3% of the target time.
-        PollDelay = PollMin # Initial poll delay will be 2x PollMin
-        while EvaluatedResult != "passed" and TimeRemaining:
-            EvaluationStartTime = time.perf_counter()
-            if OperatorKeyword is None:
-                BuiltIn().log("Evaluating boolean expression: %s" % (LeftOperand))
-                # Evaluate boolean expression
-                lValue, s_LeftOperand = RobotChecks.__evaluateOperand(LeftOperand)
-                EvaluatedResult = "failed" if str(lValue).lower() != "true" else "passed"
-
-            else:
-                lValue, s_LeftOperand = RobotChecks.__evaluateOperand(LeftOperand)
-                if RightOperand:
-                    rValue, s_RightOperand = RobotChecks.__evaluateOperand(RightOperand)
-                    BuiltIn().log("Evaluating '%s' %s '%s'" % (lValue, OperatorKeyword, rValue))
-                    EvaluatedResult = BuiltIn().run_keyword(OperatorKeyword, lValue, rValue)
-                else:
-                    BuiltIn().log("Evaluating '%s' '%s'" % (OperatorKeyword, lValue))
-                    EvaluatedResult = BuiltIn().run_keyword(OperatorKeyword, lValue)
-
-                EvaluatedResult = "failed" if str(EvaluatedResult).lower() != "true" else "passed"
-
-            EvaluationDuration = time.perf_counter() - EvaluationStartTime
-
-            # Optimize timing
-            TimeLeft = round((StartTime + TimeOutInSeconds) - time.perf_counter(), ndigits=3)
-            TimeRemaining = TimeLeft >= 0 if TimeOutInSeconds else False
-                          # include equal to prevent failing on race conditions below 1ms accuracy.
-            if EvaluatedResult != "passed" and TimeRemaining:
-                # Polling cycle speeds up during the first and last parts of the waiting time. This
-                # increases accuracy and response time in the more critical situations, without
-                # causing an overload in polling and logging. For the maximum delay the evaluation
-                # duration of the keyword is taken into account as well.
-                PollDelay = min(TimeLeft/3, PollDelay*2)
-                PollDelay = max(PollMin, min(PollDelay, PollMax)) # > min and < max
-                time.sleep(max(PollDelay - EvaluationDuration, 0))
-
-        # Do reporting
-        if OperatorKeyword is None:
-            ReportString = f"{checkType} check on '{s_LeftOperand}'"
-        elif not RightOperand:
-            ReportString = f"{checkType} check on '{OperatorKeyword} {s_LeftOperand}'"
-        else:
-            ReportString = f"{checkType} check on '{s_LeftOperand} {OperatorKeyword} {s_RightOperand}'"
+    def use_timing_profile(self, path):
+        """
+        Loads the timing profile from the file at ``path`` and uses it for checks with a time
+        constraint.
+
+        The profile records how long each timed check took to pass, keyed by the check's text. When
+        enough history is available, a check is polled at the fastest rate around the moment it is
+        expected to pass. This shortens the time to detect that checks which are repeated often and
+        consistently take the same amount of time have passed. The file is created if it does not exist and is updated when the
+        test run ends. A file that cannot be read is reported as a warning and replaced by a new
+        profile.
+
+        Example:
+        | `Use timing profile` | ${CURDIR}/elevator_timing.json |
+        | `Check that` | _elevator doors are closed_ | within | 20 seconds |
+        """
+        if self.__engine.timingProfile is not None:
+            self.__engine.timingProfile.close()
+        self.__engine.timingProfile = TimingProfile(path)
+        BuiltIn().log(f"Using timing profile '{path}' with history for "
+                      f"{len(self.__engine.timingProfile)} checks")
 
-        if s_TimeConstraint:
-            ReportString += " within %s" % secs_to_timestr(TimeOutInSeconds)
-            if not TimeRemaining and EvaluatedResult == "passed":
-                ReportString += " (too late)"
-                raise CheckFailed(ReportString)
+    def export_timing_profile(self, path):
+        """
+        Writes the timing history collected by `Use timing profile` to the file at ``path``.
+        """
+        if self.__engine.timingProfile is None:
+            BuiltIn().fail("No timing profile in use")
+        self.__engine.timingProfile.save(path)
 
-        if EvaluatedResult == "passed":
-            BuiltIn().log(ReportString)
-        else:
-            raise CheckFailed(ReportString)
+    def reset_timing_profile(self, checkText=None):
+        """
+        Clears the timing history collected by `Use timing profile`.
 
-    @staticmethod
-    def __evaluateOperand(operand):
-        # Create string variant of operands for reporting purposes
-        s_Operand = " ".join([str(elm) for elm in operand])
-        s_Value = str()
+        When ``checkText`` is given, only the history of that check is removed. The check text is
+        the full text of the check's arguments, separated by single spaces, e.g.
+        ``elevator doors are closed within 20 seconds``.
+        """
+        if self.__engine.timingProfile is not None:
+            self.__engine.timingProfile.reset(checkText)
 
-        if is_keyword(operand[0]):
-            Value = BuiltIn().run_keyword(*operand)
-            BuiltIn().log(f"'{s_Operand}' is '{Value}'")
-            s_Value = str(Value)
+    def use_clock(self, clock=None):
+        """
+        Sets the clock used for checks with a time constraint.
+
+        By default checks run in real time. When testing against a simulator, the simulator can
+        supply its own clock. Timed checks then follow simulated time, and the waiting time between
+        polls is used to advance the simulation instead of waiting in real time. A check ``within 1
+        minute`` then only takes as long as it takes to simulate that minute.
+
+        ``clock`` can be any object with a ``time()`` method, returning the current time in seconds,
+        and a ``sleep(seconds)`` method. It can also be the name of a library that offers these
+        methods. ``robotnl.clock.VirtualClock`` offers a basic implementation. Use without
+        arguments to return to real time.
+
+        Example:
+        | ${clock}= | _simulation clock_ |
+        | `Use clock` | ${clock} |
+        | `Check that` | _elevator floor_ | `equals` | 3 | within | 1 minute |
+        | `Use clock` |
+        """
+        if clock is None:
+            clock = RealTimeClock()
+        elif isinstance(clock, str):
+            clock = BuiltIn().get_library_instance(clock)
+        if not callable(getattr(clock, 'time', None)) or not callable(getattr(clock, 'sleep', None)):
+            raise TypeError(f"Clock must offer time() and sleep() methods: {clock}")
+        self.__engine.clock = clock
+
+    def use_direct_operator_calls(self, enabled=True):
+        """
+        Calls robotnl's own operators, like `equals` and `contains text`, directly instead of
+        running them as Robot keywords.
 
-        else:
-            if len(operand) == 1:
-                Value = BuiltIn().replace_variables(operand[0])
-                if Value == operand[0]:
-                    BuiltIn().log(f"Interpreting '{s_Operand}' as fixed value", level='DEBUG')
-                else:
-                    s_Value = str(Value)
-                    BuiltIn().log(f"Interpreting '{s_Operand}' as fixed value '{s_Value}'", level='DEBUG')
+        This makes checks faster, especially when polling with a time constraint or when checking
+        many values in a loop. Operators are still looked up as keywords, so that user keywords
+        and libraries with the same name take precedence as usual. Instead of a keyword entry in
+        the log, each direct operator call results in a single log line with the operator and its
+        result. Operator arguments are passed as evaluated by the check, without Robot processing
+        escapes and variables in them a second time.
 
-            else:
-                Value = list()
-                for item in operand:
-                    Value.append(BuiltIn().replace_variables(item))
-                s_Value = str(Value)
-                BuiltIn().log(f"Interpreting '{s_Operand}' as list '{s_Value}'", level='DEBUG')
+        Use ``enabled=False`` to return to running all operators as Robot keywords.
 
-        if s_Value:
-            if len(s_Value) > 83:
-                s_Value = s_Value[:40] + "..." + s_Value[-40:]
+        Example:
+        | `Use direct operator calls` |
+        | `Check that` | _elevator floor_ | `equals` | 3 | within | 20 seconds |
+        """
+        self.__engine.directOperators = enabled
 
-            s_Operand += f" [{s_Value}]"
+    def use_shared_samples(self, max_age="0 seconds", enabled=True):
+        """
+        Shares the results of keywords in check operands between checks, to reduce the load on
+        the system under test when several checks observe the same state.
+
+        When a keyword with the same arguments is already being evaluated for another check, for
+        example from another thread, its result is awaited and shared instead of starting another
+        evaluation. When a keyword with the same arguments was evaluated less than ``max_age``
+        ago, that result is reused. With the default ``max_age`` of 0, only evaluations that are
+        still in progress are shared. Only use a ``max_age`` that the observed state can be
+        trusted to stay the same for, and do not use sharing for keywords with side effects.
+        The age of a result is determined using the clock set by `Use clock`.
+
+        Use ``enabled=False`` to evaluate all keywords again for every check. See `Log shared
+        sample statistics` for how often results were shared.
+
+        Example:
+        | `Use shared samples` | max_age=200 ms |
+        | `Check that` | _elevator state_ | `equals` | moving | unless | _elevator state_ | `equals` | halted |
+        """
+        if not enabled:
+            self.__engine.sharedSamples = None
+            return
+        self.__engine.sharedSamples = SharedSamples(lambda: self.__engine.clock.time(),
+                                                    timestr_to_secs(max_age))
 
-        return Value, s_Operand
+    def log_shared_sample_statistics(self):
+        """
+        Logs and returns how many keyword evaluations were done since `Use shared samples`, and
+        how often a result was shared instead.
+        """
+        if self.__engine.sharedSamples is None:
+            BuiltIn().log("Samples are not shared")
+            return None
+        statistics = self.__engine.sharedSamples.statistics()
+        BuiltIn().log(", ".join(f"{name}: {count}" for name, count in statistics.items()))
+        return statistics
@@ -31,7 +31,10 @@
 from .version import VERSION
 from .RobotChecks import RobotChecks
 from .CheckOperator import CheckOperator
+from .check_engine import CheckEngine, PythonExecutor
 from .inline_keywords import keyword
+from .preresolver import PreResolver
+from .profiler import Profiler
 
 class robotnl(RobotChecks, CheckOperator):
     """
@@ -0,0 +1,668 @@
+# -*- coding: utf-8 -*-
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, J. Foederer
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from robot.libraries.BuiltIn import BuiltIn
+from robot.running import EXECUTION_CONTEXTS
+from robot.utils import normalize, timestr_to_secs, secs_to_timestr
+from robot.variables import contains_variable
+
+import re
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Mapping
+from functools import wraps
+
+from .CheckOperator import CheckOperator, Mismatch, file_scans
+from .check_plan import CheckPlan
+from .clock import RealTimeClock
+from .inline_keywords import is_keyword, KeywordCache
+from .profiler import profiled, log, logging_to
+
+NO_VALUE = object() # Value of a variable that is not set
+
+class CheckFailed(RuntimeError):
+    ROBOT_CONTINUE_ON_FAILURE = True
+
+# Operators that can be called directly, without going through Robot's keyword execution
+DIRECT_OPERATORS = {func for func in vars(CheckOperator).values() if callable(func)}
+
+
+class Executor(ABC):
+    """
+    Interface through which the check engine finds and runs keywords, replaces variables and logs.
+    """
+    @abstractmethod
+    def is_keyword(self, name):
+        """Returns whether name is the name of a keyword"""
+
+    @abstractmethod
+    def run_keyword(self, name, *args):
+        """Runs the keyword, replacing variables in its arguments, and returns its result"""
+
+    def direct_operator(self, name):
+        """
+        Returns a function that can be called with evaluated values instead of running the
+        operator keyword name, or None if the operator must be run as keyword.
+        """
+        return None
+
+    @abstractmethod
+    def replace_variables(self, text):
+        """Returns text with its variables replaced. A single variable is replaced by its value."""
+
+    @abstractmethod
+    def set_variable(self, name, value):
+        """
+        Sets the variable to value and returns its previous value, or NO_VALUE if it was not set.
+        Setting NO_VALUE removes the variable, where the executor allows variables to be removed.
+        """
+
+    @abstractmethod
+    def log(self, message, level='INFO'):
+        """Logs the message at level: 'TRACE', 'DEBUG', 'INFO', 'WARN' or 'ERROR'"""
+
+
+class RobotExecutor(Executor):
+    """Executor for checks run as Robot keywords, in Robot's execution context"""
+    def __init__(self):
+        self.__direct_operators = KeywordCache()
+
+    def is_keyword(self, name):
+        return is_keyword(name)
+
+    def run_keyword(self, name, *args):
+        return BuiltIn().run_keyword(name, *args)
+
+    def direct_operator(self, name):
+        operator = self.__direct_operators.get(name)
+        if operator is None:
+            operator = RobotExecutor.__resolve_direct_operator(name)
+            self.__direct_operators.set(name, operator)
+        return operator or None
+
+    @staticmethod
+    def __resolve_direct_operator(operatorKeyword):
+        try:
+            runner = EXECUTION_CONTEXTS.current.namespace.get_runner(operatorKeyword,
+                                                                    recommend_on_failure=False)
+            keyword = runner.keyword
+            method = keyword.method
+            if keyword.error or keyword.embedded or runner.pre_run_messages:
+                return False
+        except Exception:
+            return False
+        if getattr(method, '__func__', None) not in DIRECT_OPERATORS or \
+           getattr(method, 'robotnl_inline_keywords', False):
+            # Not one of ours, or one that requires Robot's argument handling
+            return False
+        return method
+
+    def replace_variables(self, text):
+        return BuiltIn().replace_variables(text)
+
+    def set_variable(self, name, value):
+        Previous = BuiltIn().get_variable_value(name, NO_VALUE)
+        if value is not NO_VALUE:
+            # Robot has no public way to remove a local variable, so it keeps its last value
+            BuiltIn().set_local_variable(name, value)
+        return Previous
+
+    def log(self, message, level='INFO'):
+        log(message, level)
+
+
+class PythonExecutor(Executor):
+    """
+    Executor for running checks from plain Python, without Robot's execution context. Keywords
+    are Python functions, found by name the way Robot finds them: ignoring case, spaces and
+    underscores. Variables are kept in a dictionary. Besides plain ``${name}``, variables support
+    attribute access, like ``${row.actual}``, and item access, like ``${row}[actual]``. Other
+    variable syntax is not supported and fails.
+
+    ``libraries`` are objects whose public methods become keywords, in addition to robotnl's own
+    operators. ``keywords`` maps additional keyword names to functions. Log messages, including
+    those of robotnl's operators, are passed to ``output``, if given, a function taking a single
+    text argument.
+
+    Example:
+    | engine = CheckEngine(PythonExecutor(keywords={'elevator floor': elevator.floor}))
+    | engine.execute_check("Requirement", ["elevator floor", "equals", "3", "within", "20 s"])
+    """
+    __variable = re.compile(r'\$\{([^{}]+)\}((?:\[[^\[\]]*\])*)')
+    __item = re.compile(r'\[([^\[\]]*)\]')
+
+    def __init__(self, libraries=(), keywords=None, variables=None, output=None):
+        self.output = output
+        self.variables = dict(variables or {}) # variable name without decoration → value
+        self.__keywords = dict() # normalized name → function
+        for library in (CheckOperator(), *libraries):
+            self.add_library(library)
+        for name, function in (keywords or {}).items():
+            self.add_keyword(name, function)
+
+    def add_library(self, library):
+        """Adds the public methods of library as keywords, like Robot does for a library"""
+        for attribute in dir(library):
+            method = getattr(library, attribute)
+            if attribute.startswith('_') or not callable(method):
+                continue
+            name = getattr(method, 'robot_name', None) or attribute
+            if '${' in name:
+                continue # Embedded arguments need Robot's keyword matching
+            if getattr(method, 'robotnl_inline_keywords', False):
+                # Inline keywords in arguments are resolved using Robot. Call the plain method.
+                method = method.__wrapped__.__get__(library)
+            self.add_keyword(name, method)
+
+    def add_keyword(self, name, function):
+        @wraps(function)
+        def keyword(*args):
+            with logging_to(self.log): # Instead of Robot's log
+                return function(*args)
+        self.__keywords[normalize(name, ignore='_')] = keyword
+
+    def is_keyword(self, name):
+        return isinstance(name, str) and normalize(name, ignore='_') in self.__keywords
+
+    def run_keyword(self, name, *args):
+        function = self.direct_operator(name)
+        if function is None:
+            raise RuntimeError(f"No keyword with name '{name}' found.")
+        return function(*[self.replace_variables(arg) for arg in args])
+
+    def direct_operator(self, name):
+        return self.__keywords.get(normalize(name, ignore='_')) if isinstance(name, str) else None
+
+    def replace_variables(self, text):
+        if not isinstance(text, str) or '{' not in text:
+            return text
+        if contains_variable(self.__variable.sub('', text)):
+            raise RuntimeError(f"Variable syntax in '{text}' is not supported without Robot. Use "
+                               f"${{name}}, ${{name.attribute}} or ${{name}}[item].")
+        whole = self.__variable.fullmatch(text)
+        if whole:
+            return self.__value(whole)
+        return self.__variable.sub(lambda match: str(self.__value(match)), text)
+
+    def __value(self, match):
+        name, items = match.groups()
+        if name in self.variables:
+            Value = self.variables[name]
+        else:
+            base, *attributes = name.split('.')
+            if base not in self.variables:
+                raise RuntimeError(f"Variable '${{{base}}}' not found.")
+            Value = self.variables[base]
+            for attribute in attributes:
+                if isinstance(Value, Mapping) and attribute in Value:
+                    Value = Value[attribute]
+                elif attribute.isidentifier() and hasattr(Value, attribute):
+                    Value = getattr(Value, attribute)
+                else:
+                    raise RuntimeError(f"Variable '${{{name}}}' not found: "
+                                       f"{type(Value).__name__} has no attribute '{attribute}'.")
+        for item in self.__item.findall(items):
+            try:
+                Value = Value[item] if isinstance(Value, Mapping) else Value[int(item)]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise RuntimeError(f"Variable '{match.group()}' not found: "
+                                   f"{type(Value).__name__} has no item '{item}'.") from None
+        return Value
+
+    def set_variable(self, name, value):
+        name = name[2:-1] if name.startswith('${') else name
+        Previous = self.variables.get(name, NO_VALUE)
+        if value is not NO_VALUE:
+            self.variables[name] = value
+        elif Previous is not NO_VALUE:
+            del self.variables[name]
+        return Previous
+
+    def log(self, message, level='INFO'):
+        if self.output:
+            self.output(f"{level}: {message}")
+
+
+class CheckEngine:
+    """
+    Parses and executes checks, including their time constraints and guard conditions. All
+    keywords, variables and logging go through an executor, so that the same engine runs checks
+    as Robot keywords or from plain Python.
+
+    Time is read from ``clock``, see `Use clock`. When ``timingProfile`` is set, timed checks
+    poll around the moment they are expected to pass. When ``sharedSamples`` is set, the results
+    of operand keywords are shared between checks. When ``directOperators`` is set, operators
+    that the executor can call directly are not run as keywords.
+    """
+    HISTORY_SIZE = 10 # Number of most recent evaluations reported when a timed check fails
+    FAILED_ROWS_REPORTED = 20 # Number of failed rows reported by a check for each row
+    TIMELINE_SIZE = 20 # Number of most recent timeline entries reported by a sustained check
+
+    def __init__(self, executor, clock=None):
+        self.executor = executor
+        self.clock = clock or RealTimeClock()
+        self.timingProfile = None
+        self.sharedSamples = None
+        self.directOperators = False
+
+    def plan(self, checkType, args):
+        """Parses the arguments of a check into a check plan"""
+        return CheckPlan(checkType, args, self.executor.is_keyword)
+
+    def execute_check(self, checkType, args):
+        """
+        Parse arguments for check keyword to determine its operands, evaluate them and execute the
+        check.
+        """
+        with file_scans():
+            return self.__execute_check(checkType, args)
+
+    def __execute_check(self, checkType, args):
+        Plan = self.plan(checkType, args)
+        CheckText = Plan.checkText
+
+        ############################################################################################
+        # Evaluate time argument
+        TimeOutInSeconds = 0
+        TimeRemaining = True
+        s_TimeConstraint = Plan.timeConstraint
+        if s_TimeConstraint:
+            EvaluatedTimeArg = self.__evaluateOperand([s_TimeConstraint])[0]
+            TimeOutInSeconds = timestr_to_secs(EvaluatedTimeArg)
+        if Plan.timeMode == 'during':
+            return self.__execute_sustained_check(Plan, TimeOutInSeconds)
+
+        ###########################################################################################
+        # Evaluate expression
+        EvaluatedResult = None
+
+        StartTime = self.clock.time()
+        TimeLeft = TimeOutInSeconds
+        PollMax = 20 # After 20s people start wondering: "Is it still going?" Time for an update.
+        PollMin = min(PollMax/8, TimeOutInSeconds*3/100) # Shortest delay is 3% of the target time.
+        PollDelay = PollMin # Initial poll delay will be 2x PollMin
+        ExpectedWindow = None
+        if self.timingProfile is not None and TimeOutInSeconds:
+            ExpectedWindow = self.timingProfile.expected_window(CheckText)
+        GuardTriggered = False
+        History = deque(maxlen=self.HISTORY_SIZE) # (time, result, evaluated expression)
+        Evaluations = 0
+        LastFailedAt = 0 # The check became true after its last failing evaluation started
+        while EvaluatedResult != "passed" and TimeRemaining:
+            EvaluationStartTime = self.clock.time()
+            EvaluatedResult, s_Expression, Outcome = self.evaluate_plan(Plan)
+            History.append((EvaluationStartTime - StartTime, EvaluatedResult, s_Expression))
+            Evaluations += 1
+            if EvaluatedResult != "passed":
+                LastFailedAt = EvaluationStartTime - StartTime
+            if EvaluatedResult != "passed" and Plan.guard:
+                GuardResult, s_Guard, _ = self.evaluate_plan(Plan.guard)
+                if GuardResult == "passed":
+                    GuardTriggered = True
+                    Elapsed = self.clock.time() - StartTime
+                    break
+
+            EvaluationDuration = self.clock.time() - EvaluationStartTime
+
+            # Optimize timing
+            TimeLeft = round((StartTime + TimeOutInSeconds) - self.clock.time(), ndigits=3)
+            TimeRemaining = TimeLeft >= 0 if TimeOutInSeconds else False
+                          # include equal to prevent failing on race conditions below 1ms accuracy.
+            Elapsed = self.clock.time() - StartTime
+            if EvaluatedResult != "passed" and TimeRemaining:
+                # Polling cycle speeds up during the first and last parts of the waiting time. This
+                # increases accuracy and response time in the more critical situations, without
+                # causing an overload in polling and logging. For the maximum delay the evaluation
+                # duration of the keyword is taken into account as well.
+                PollDelay = min(TimeLeft/3, PollDelay*2)
+                PollDelay = max(PollMin, min(PollDelay, PollMax)) # > min and < max
+                Delay = PollDelay - EvaluationDuration
+                if ExpectedWindow and Elapsed < ExpectedWindow[0] - PollMin:
+                    # From the timing profile it is known when the check usually passes. Do not
+                    # poll past the start of that window.
+                    Delay = min(Delay, ExpectedWindow[0] - Elapsed)
+                elif ExpectedWindow and Elapsed <= ExpectedWindow[1]:
+                    # Poll at the fastest rate until the window closes and speed down from there
+                    PollDelay = PollMin
+                    Delay = PollMin - EvaluationDuration
+                self.__sleep(max(Delay, 0))
+
+        # Do reporting
+        ReportString = f"{checkType} check on {s_Expression}"
+        s_History = ""
+        if Evaluations > 1:
+            s_History = "\n" + CheckEngine.__format_history(History, Evaluations)
+
+        if s_TimeConstraint:
+            ReportString += " within %s" % secs_to_timestr(TimeOutInSeconds)
+            if not TimeRemaining and EvaluatedResult == "passed":
+                ReportString += " (too late)"
+                raise CheckFailed(ReportString + s_History)
+            if self.timingProfile is not None and EvaluatedResult == "passed":
+                self.timingProfile.record(CheckText, LastFailedAt)
+
+        if GuardTriggered:
+            ReportString += f" failed early, because {s_Guard} became true"
+            if s_TimeConstraint:
+                ReportString += f" after {secs_to_timestr(round(Elapsed, 3))}"
+            raise CheckFailed(ReportString + s_History)
+
+        if EvaluatedResult == "passed":
+            self.executor.log(ReportString)
+        else:
+            raise CheckFailed(ReportString + CheckEngine.__explain(Outcome) + s_History)
+
+    @staticmethod
+    def __format_history(history, evaluations):
+        """
+        Renders the most recent evaluations of a timed check as a compact table, one line per
+        evaluation, with the time since the start of the check.
+        """
+        if evaluations > len(history):
+            s_Header = f"Last {len(history)} of {evaluations} evaluations:"
+        else:
+            s_Header = f"All {evaluations} evaluations:"
+        return "\n".join([s_Header] + [f"{sampleTime:9.3f}s {result:6} {expression}"
+                                        for sampleTime, result, expression in history])
+
+    def execute_table_check(self, checkType, rows, args):
+        """
+        Evaluates a check for each row, with the row assigned to ${row}. The check is parsed and
+        compiled once, so that the loop over the rows only evaluates.
+        """
+        Plan = self.plan(checkType, args)
+        if Plan.timeConstraint or Plan.guard:
+            raise AssertionError("Checks for each row cannot have a time constraint or guard "
+                                 "condition")
+        if isinstance(rows, str):
+            raise AssertionError(f"Rows must be a list, not text '{rows}'")
+        Evaluate = self.__compile_plan(Plan)
+
+        PreviousRow = NO_VALUE
+        Reported = list() # Descriptions of the first failed rows
+        Failed = 0
+        Rows = 0
+        try:
+            for Index, Row in enumerate(rows):
+                Previous = self.executor.set_variable('${row}', Row)
+                if not Rows:
+                    PreviousRow = Previous
+                EvaluatedResult, s_Expression, Outcome = Evaluate()
+                if EvaluatedResult != "passed":
+                    Failed += 1
+                    if Failed <= self.FAILED_ROWS_REPORTED:
+                        # Described right away, so that the outcome need not be kept
+                        Reported.append(f"row {Index}: {s_Expression}" +
+                                        CheckEngine.__explain(Outcome).replace("\n", "\n    "))
+                Rows += 1
+        finally:
+            if Rows:
+                self.executor.set_variable('${row}', PreviousRow)
+
+        ReportString = f"{checkType} check for each row on {Plan.expression()}: " \
+                       f"{Rows - Failed} of {Rows} rows passed"
+        if not Failed:
+            self.executor.log(ReportString)
+            return
+        s_Failures = "\n".join(Reported)
+        if Failed > len(Reported):
+            s_Failures += f"\n... and {Failed - len(Reported)} more failed rows"
+        raise CheckFailed(f"{ReportString}, {Failed} failed:\n{s_Failures}")
+
+    @profiled("check compilation")
+    def __compile_plan(self, plan):
+        """
+        Returns a function that evaluates the check plan without logging, like evaluate_plan.
+        Deciding whether operands are keywords and looking up the operator is done only once,
+        here, instead of on each evaluation.
+        """
+        LeftOperand = self.__compile_operand(plan.leftOperand)
+        if plan.operatorKeyword is None:
+            def evaluate():
+                EvaluatedResult, s_LeftOperand = LeftOperand()
+                return EvaluatedResult, f"'{s_LeftOperand}'"
+        else:
+            Operator = self.executor.direct_operator(plan.operatorKeyword) \
+                       if self.directOperators else None
+            if Operator is None:
+                OperatorKeyword = plan.operatorKeyword
+                Operator = lambda *values: self.executor.run_keyword(OperatorKeyword, *values)
+            if plan.rightOperand:
+                RightOperand = self.__compile_operand(plan.rightOperand)
+                def evaluate():
+                    lValue, s_LeftOperand = LeftOperand()
+                    rValue, s_RightOperand = RightOperand()
+                    return Operator(lValue, rValue), \
+                           f"'{s_LeftOperand} {plan.operatorKeyword} {s_RightOperand}'"
+            else:
+                def evaluate():
+                    lValue, s_LeftOperand = LeftOperand()
+                    return Operator(lValue), f"'{plan.operatorKeyword} {s_LeftOperand}'"
+
+        def evaluate_plan():
+            EvaluatedResult, s_Expression = evaluate()
+            return "failed" if str(EvaluatedResult).lower() != "true" else "passed", \
+                   s_Expression, EvaluatedResult
+        return evaluate_plan
+
+    def __compile_operand(self, operand):
+        """
+        Returns a function that evaluates the operand without logging, like __evaluateOperand.
+        """
+        s_Operand = " ".join([str(elm) for elm in operand])
+        replace_variables = self.executor.replace_variables
+        describe = CheckEngine.__describe_operand
+        if self.executor.is_keyword(operand[0]):
+            if self.sharedSamples is None:
+                run = lambda: self.executor.run_keyword(*operand)
+            else:
+                run = lambda: self.__shared_sample(operand)
+            def evaluate():
+                Value = run()
+                return Value, describe(s_Operand, str(Value))
+        elif len(operand) == 1:
+            def evaluate():
+                Value = replace_variables(operand[0])
+                return Value, describe(s_Operand, "" if Value == operand[0] else str(Value))
+        else:
+            def evaluate():
+                Value = [replace_variables(item) for item in operand]
+                return Value, describe(s_Operand, str(Value))
+        return evaluate
+
+    def __shared_sample(self, operand):
+        try:
+            key = tuple(self.executor.replace_variables(arg) for arg in operand)
+            hash(key)
+        except TypeError:
+            # Values that cannot be told apart are not shared
+            return self.executor.run_keyword(*operand)
+        return self.sharedSamples.sample(key, lambda: self.executor.run_keyword(*operand))
+
+    def evaluate_invariant(self, plan):
+        """
+        Evaluates a check plan once, without logging. A true guard condition excuses a check that
+        is not true.
+        """
+        EvaluatedResult, s_Expression, _ = self.evaluate_plan(plan, verbose=False)
+        if EvaluatedResult != "passed" and plan.guard:
+            GuardResult, s_Guard, _ = self.evaluate_plan(plan.guard, verbose=False)
+            if GuardResult == "passed":
+                return "passed", f"{s_Expression} unless {s_Guard}"
+        return EvaluatedResult, s_Expression
+
+    @profiled("polling sleep", kind='waiting')
+    def __sleep(self, seconds):
+        self.clock.sleep(seconds)
+
+    def __execute_sustained_check(self, plan, durationInSeconds):
+        """
+        Executes a check that must remain true for the given duration. The check is sampled at a
+        steady rate, from the start up to and including the end of the duration, and fails on the
+        first sample that is false. Only the first sample is logged in full. The samples are
+        summarised in a compact timeline, listing how long each evaluated expression lasted. Only
+        the most recent entries of the timeline are kept.
+        """
+        StartTime = self.clock.time()
+        SampleInterval = min(20/8, durationInSeconds*3/100) # Same as the fastest polling rate
+        # [first sample time, last sample time, number of samples, expression]
+        Timeline = deque(maxlen=self.TIMELINE_SIZE)
+        LeftOut = 0 # Number of timeline entries dropped to keep the most recent ones
+        while True:
+            SampleStartTime = self.clock.time()
+            SampleTime = SampleStartTime - StartTime
+            EvaluatedResult, s_Expression, Outcome = self.evaluate_plan(plan,
+                                                                        verbose=not Timeline)
+            if Timeline and Timeline[-1][3] == s_Expression:
+                Timeline[-1][1] = SampleTime
+                Timeline[-1][2] += 1
+            else:
+                if len(Timeline) == Timeline.maxlen:
+                    LeftOut += 1
+                Timeline.append([SampleTime, SampleTime, 1, s_Expression])
+
+            TimeLeft = durationInSeconds - (self.clock.time() - StartTime)
+            if EvaluatedResult != "passed" or SampleTime >= durationInSeconds:
+                break
+            EvaluationDuration = self.clock.time() - SampleStartTime
+            self.__sleep(max(min(SampleInterval - EvaluationDuration, TimeLeft), 0))
+
+        s_Timeline = "\n".join(f"{first:.3f}s - {last:.3f}s: {expression} ({count} samples)"
+                                if count > 1 else f"{first:.3f}s: {expression}"
+                                for first, last, count, expression in Timeline)
+        if LeftOut:
+            s_Timeline = f"... {LeftOut} earlier timeline entries left out\n{s_Timeline}"
+        ReportString = f"{plan.checkType} check on {s_Expression} during " \
+                       f"{secs_to_timestr(durationInSeconds)}"
+        if EvaluatedResult == "passed":
+            self.executor.log(f"{ReportString}\n{s_Timeline}")
+        else:
+            ReportString += f" failed after {secs_to_timestr(round(SampleTime, 3))}"
+            raise CheckFailed(f"{ReportString}{CheckEngine.__explain(Outcome)}\n{s_Timeline}")
+
+    @staticmethod
+    def __explain(outcome):
+        """Returns the explanation of an operator's negative outcome, if it offers one"""
+        return f"\n{outcome.explain()}" if isinstance(outcome, Mismatch) else ""
+
+    def evaluate_plan(self, plan, verbose=True):
+        """
+        Evaluates the operands and operator of a check once. Returns whether the check "passed" or
+        "failed", together with the evaluated expression in text for reporting and the result of
+        the evaluation itself. With verbose=False the engine does not log the evaluation steps.
+        """
+        if plan.operatorKeyword is None:
+            if verbose:
+                self.executor.log("Evaluating boolean expression: %s" % (plan.leftOperand))
+            # Evaluate boolean expression
+            EvaluatedResult, s_LeftOperand = self.__evaluateOperand(plan.leftOperand, verbose)
+            s_Expression = f"'{s_LeftOperand}'"
+
+        else:
+            lValue, s_LeftOperand = self.__evaluateOperand(plan.leftOperand, verbose)
+            if plan.rightOperand:
+                rValue, s_RightOperand = self.__evaluateOperand(plan.rightOperand, verbose)
+                EvaluatedResult = self.__run_operator(plan.operatorKeyword, lValue, rValue,
+                                                      verbose=verbose)
+                s_Expression = f"'{s_LeftOperand} {plan.operatorKeyword} {s_RightOperand}'"
+            else:
+                EvaluatedResult = self.__run_operator(plan.operatorKeyword, lValue, verbose=verbose)
+                s_Expression = f"'{plan.operatorKeyword} {s_LeftOperand}'"
+
+        return "failed" if str(EvaluatedResult).lower() != "true" else "passed", s_Expression, \
+               EvaluatedResult
+
+    def __run_operator(self, operatorKeyword, *values, verbose=True):
+        if len(values) == 1:
+            s_Evaluation = f"'{operatorKeyword}' '{values[0]}'"
+        else:
+            s_Evaluation = f"'{values[0]}' {operatorKeyword} '{values[1]}'"
+
+        operator = self.executor.direct_operator(operatorKeyword) if self.directOperators else None
+        if operator is None:
+            if verbose:
+                self.executor.log(f"Evaluating {s_Evaluation}")
+            return self.executor.run_keyword(operatorKeyword, *values)
+
+        result = operator(*values)
+        if verbose:
+            self.executor.log(f"Evaluated {s_Evaluation}: {result}")
+        return result
+
+    def __evaluateOperand(self, operand, verbose=True):
+        # Create string variant of operands for reporting purposes
+        s_Operand = " ".join([str(elm) for elm in operand])
+        s_Value = str()
+
+        if self.executor.is_keyword(operand[0]):
+            if self.sharedSamples is None:
+                Value = self.executor.run_keyword(*operand)
+            else:
+                Value = self.__shared_sample(operand)
+            if verbose:
+                self.executor.log(f"'{s_Operand}' is '{Value}'")
+            s_Value = str(Value)
+
+        else:
+            if len(operand) == 1:
+                Value = self.executor.replace_variables(operand[0])
+                if Value == operand[0]:
+                    if verbose:
+                        self.executor.log(f"Interpreting '{s_Operand}' as fixed value",
+                                          level='DEBUG')
+                else:
+                    s_Value = str(Value)
+                    if verbose:
+                        self.executor.log(f"Interpreting '{s_Operand}' as fixed value "
+                                          f"'{s_Value}'", level='DEBUG')
+
+            else:
+                Value = list()
+                for item in operand:
+                    Value.append(self.executor.replace_variables(item))
+                s_Value = str(Value)
+                if verbose:
+                    self.executor.log(f"Interpreting '{s_Operand}' as list '{s_Value}'",
+                                      level='DEBUG')
+
+        return Value, CheckEngine.__describe_operand(s_Operand, s_Value)
+
+    @staticmethod
+    def __describe_operand(s_Operand, s_Value):
+        """Adds the evaluated value, if any, to the operand text for reporting"""
+        if s_Value:
+            if len(s_Value) > 83:
+                s_Value = s_Value[:40] + "..." + s_Value[-40:]
+
+            s_Operand += f" [{s_Value}]"
+
+        return s_Operand
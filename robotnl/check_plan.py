@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, J. Foederer
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from robot.libraries.BuiltIn import BuiltIn
+
+from .inline_keywords import is_keyword
+from .profiler import profiled
+
+GUARD_MARKERS = ('unless', 'fail if')
+TIME_MARKERS = {'within': 'within', 'during': 'during', 'remains for': 'during'}
+# Reserved words are taken as markers. Preceded by a backslash, they are taken as plain text.
+RESERVED_WORDS = {*GUARD_MARKERS, *TIME_MARKERS}
+
+def _unescape_reserved(arg):
+    """Removes the backslash from an escaped reserved word, leaving all other arguments as is"""
+    if isinstance(arg, str) and arg.startswith('\\') and arg[1:].lower() in RESERVED_WORDS:
+        return arg[1:]
+    return arg
+
+class CheckPlan:
+    """
+    Structure of a check as determined from the arguments of a check keyword: its left operand,
+    operator, right operand, time constraint and guard condition. The guard condition is a plan of
+    its own. Building a plan only looks up which arguments are keywords, using isKeyword. Nothing
+    is evaluated until the check is executed.
+    """
+    @profiled("check parsing")
+    def __init__(self, checkType, args, isKeyword=is_keyword):
+        self.checkType = checkType
+        self.checkText = " ".join([str(arg) for arg in args])
+        Arguments = list(args)
+
+        ############################################################################################
+        # check for guard condition
+        self.guard = None
+        GuardArguments = list()
+        for i, arg in enumerate(Arguments):
+            if str(arg).lower() in GUARD_MARKERS:
+                GuardArguments = Arguments[i+1:]
+                Arguments = Arguments[:i]
+                if len(GuardArguments) >= 2 and str(GuardArguments[-2]).lower() in TIME_MARKERS:
+                    # Time constraint placed after the guard still applies to the check
+                    Arguments += GuardArguments[-2:]
+                    GuardArguments = GuardArguments[:-2]
+                if not GuardArguments:
+                    BuiltIn().fail(f"Missing guard condition after '{arg}'")
+                break
+
+        ############################################################################################
+        # check for time argument
+        self.timeConstraint = ""
+        self.timeMode = None # 'within' to become true, 'during' to remain true
+        if len(Arguments) >= 2 and str(Arguments[-2]).lower() in TIME_MARKERS:
+            self.timeMode = TIME_MARKERS[str(Arguments[-2]).lower()]
+            self.timeConstraint = Arguments[-1]
+            Arguments = Arguments[:-2]
+
+        if not len(Arguments):
+            BuiltIn().fail("%s check failed. There was nothing to check." % checkType)
+
+        ############################################################################################
+        # Build expression
+        self.leftOperand = list()
+        self.operatorKeyword = None
+        self.rightOperand = list()
+
+        # Single argument or the first argument is a keyword AND No other arguments are keywords
+        if len(Arguments) == 1 or \
+           isKeyword(Arguments[0]) and not list(filter(isKeyword, Arguments[1:])):
+            # Interpret as single boolean expression
+            self.leftOperand = Arguments
+
+        else: # Interpret as expression
+            self.leftOperand.append(Arguments.pop(0))
+
+            NextArgument = Arguments.pop(0)
+            while not isKeyword(NextArgument):
+                self.leftOperand.append(NextArgument)
+
+                # Prepare next loop
+                if not len(Arguments):
+                    BuiltIn().fail("Missing operator in check keyword")
+                NextArgument = Arguments.pop(0)
+
+            self.operatorKeyword = NextArgument
+            self.rightOperand = list(Arguments)
+
+        self.leftOperand = [_unescape_reserved(arg) for arg in self.leftOperand]
+        self.rightOperand = [_unescape_reserved(arg) for arg in self.rightOperand]
+
+        if GuardArguments:
+            self.guard = CheckPlan("Guard", GuardArguments, isKeyword)
+            if self.guard.timeConstraint:
+                BuiltIn().fail("Guard conditions cannot have their own time constraint")
+            if self.timeMode == 'during':
+                BuiltIn().fail("Guard conditions cannot be used on checks that must remain true")
+
+    def __str__(self):
+        return f"{self.checkType} check on {self.expression()}"
+
+    def expression(self):
+        s_LeftOperand = " ".join([str(elm) for elm in self.leftOperand])
+        s_RightOperand = " ".join([str(elm) for elm in self.rightOperand])
+        if self.operatorKeyword is None:
+            PlanString = f"boolean expression '{s_LeftOperand}'"
+        elif not self.rightOperand:
+            PlanString = f"operator '{self.operatorKeyword}' on '{s_LeftOperand}'"
+        else:
+            PlanString = f"'{s_LeftOperand}' operator '{self.operatorKeyword}' '{s_RightOperand}'"
+        if self.timeConstraint:
+            PlanString += f" {self.timeMode} '{self.timeConstraint}'"
+        if self.guard:
+            PlanString += f" unless {self.guard.expression()}"
+        return PlanString
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, J. Foederer
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import time
+
+
+class RealTimeClock:
+    """
+    Clock used by robotnl by default. Any object offering the same ``time()`` and ``sleep()``
+    methods can be used as clock instead, see `Use clock`.
+    """
+    def time(self):
+        """Returns the current time in seconds. Only differences between times are meaningful."""
+        return time.perf_counter()
+
+    def sleep(self, seconds):
+        """Returns after the given number of seconds has passed"""
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    Clock for use with simulators. Instead of waiting, sleeping advances the virtual time. When
+    an ``advance`` function is given, it is called with the number of seconds to advance,
+    allowing a simulation to run for that amount of simulated time.
+    """
+    def __init__(self, start=0.0, advance=None):
+        self.now = float(start)
+        self.__advance = advance
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        if self.__advance:
+            self.__advance(seconds)
+        self.now += seconds
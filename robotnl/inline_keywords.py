@@ -32,14 +32,160 @@
 
 from robot.libraries.BuiltIn import BuiltIn
 from robot.api.deco import keyword as robot_keyword
-from robot.utils import type_name
+from robot.utils import normalize, type_name
+from robot.running import EXECUTION_CONTEXTS, Keyword
 from robot.running.arguments import TypeConverter
+from robot.variables import VariableMatches
 
+import re
 from functools import wraps
 from typing import TypeVar, Generic, Union
 
+from .profiler import profiled, log
 
+
+def _current_scope():
+    """
+    Returns the namespace of the running suite with a summary of its imports and the library
+    search order. Returns None when Robot is not running or its internals are not recognised.
+    """
+    context = EXECUTION_CONTEXTS.current
+    if context is None:
+        return None
+    try:
+        kw_store = context.namespace._kw_store
+        return (context.namespace, len(kw_store.libraries), len(kw_store.resources.values()),
+                tuple(kw_store.search_order))
+    except AttributeError:
+        # Robot internals changed. Better slow than wrong.
+        return None
+
+def _same_scope(scope, other):
+    return scope is not None and other is not None and \
+           scope[0] is other[0] and scope[1:] == other[1:]
+
+
+class KeywordCache:
+    """
+    Remembers the results of looking up texts as keywords, like whether a text is a keyword. These
+    results depend on the libraries and resources available in the running suite. They are
+    therefore only reused while the namespace, its imports and the library search order are
+    unchanged.
+    """
+    def __init__(self):
+        self.__scope = None
+        self.__known = dict()
+
+    def __in_scope(self):
+        scope = _current_scope()
+        if scope is None:
+            return False
+        if not _same_scope(scope, self.__scope):
+            self.__scope = scope
+            self.__known.clear()
+        return True
+
+    def get(self, text):
+        """Returns the remembered result, or None if unknown"""
+        if not isinstance(text, str) or not self.__in_scope():
+            return None
+        return self.__known.get(text)
+
+    def set(self, text, result):
+        if isinstance(text, str) and self.__in_scope():
+            self.__known[text] = result
+
+keyword_cache = KeywordCache()
+
+
+class KeywordIndex:
+    """
+    Index of the keyword names available in the running suite, used to quickly rule out texts
+    that cannot be a keyword.
+
+    Robot tries to match a text against every keyword with embedded arguments in scope. Here these
+    keywords are bucketed by the first, or else the last, complete word of their name. Only the
+    keywords in the buckets of the text's first and last word, and those that could not be
+    bucketed, are matched. Texts that the index cannot rule out are left to Robot to decide.
+    """
+    __first_word = re.compile(r'(\w+)\W')
+    __last_word = re.compile(r'\W(\w+)$')
+
+    def __init__(self):
+        self.__scope = None
+        self.__normal = set()
+        self.__by_first_word = dict()
+        self.__by_last_word = dict()
+        self.__unbucketed = list()
+        self.__bdd_prefixes = ()
+
+    def might_be_keyword(self, text):
+        if not isinstance(text, str):
+            return True
+        scope = _current_scope()
+        if scope is None:
+            return True
+        if not _same_scope(scope, self.__scope):
+            try:
+                self.__build(scope[0])
+            except AttributeError:
+                return True
+            self.__scope = scope
+
+        if '.' in text or normalize(text, ignore='_') in self.__normal:
+            return True # Explicit library or resource names are left to Robot
+        lowerText = text.lower()
+        if lowerText.startswith(self.__bdd_prefixes):
+            return True
+        firstWord = re.match(r'\w+', text)
+        lastWord = re.search(r'\w+$', text)
+        if firstWord and not firstWord.group().isascii() or \
+           lastWord and not lastWord.group().isascii():
+            return True # Rely on Robot for case insensitive matching beyond ASCII
+        candidates = [*self.__unbucketed]
+        if firstWord:
+            candidates += self.__by_first_word.get(firstWord.group().lower(), [])
+        if lastWord:
+            candidates += self.__by_last_word.get(lastWord.group().lower(), [])
+        return any(kw.matches(text) for kw in candidates)
+
+    def __build(self, namespace):
+        kw_store = namespace._kw_store
+        self.__normal.clear()
+        self.__by_first_word.clear()
+        self.__by_last_word.clear()
+        self.__unbucketed.clear()
+        self.__bdd_prefixes = tuple(f"{prefix.lower()} " for prefix in
+                                    namespace.languages.bdd_prefixes)
+        for owner in (kw_store.suite_file, *kw_store.libraries.values(),
+                      *kw_store.resources.values()):
+            for kw in owner.keywords:
+                if not kw.embedded:
+                    self.__normal.add(normalize(kw.name, ignore='_'))
+                    continue
+                name = " ".join(kw.name.split())
+                matches = list(VariableMatches(name, identifiers="$"))
+                firstWord = self.__first_word.match(matches[0].before)
+                lastWord = self.__last_word.search(matches[-1].after)
+                if firstWord and firstWord.group(1).isascii():
+                    self.__by_first_word.setdefault(firstWord.group(1).lower(), []).append(kw)
+                elif lastWord and lastWord.group(1).isascii():
+                    self.__by_last_word.setdefault(lastWord.group(1).lower(), []).append(kw)
+                else:
+                    self.__unbucketed.append(kw)
+
+keyword_index = KeywordIndex()
+
+@profiled("keyword detection")
 def is_keyword(keywordCandidate):
+    known = keyword_cache.get(keywordCandidate)
+    if known is None:
+        known = keyword_index.might_be_keyword(keywordCandidate) and \
+                _lookup_keyword(keywordCandidate)
+        keyword_cache.set(keywordCandidate, known)
+    return known
+
+def _lookup_keyword(keywordCandidate):
     try:
         BuiltIn().keyword_should_exist(keywordCandidate)
     except AssertionError as error:
@@ -53,24 +199,98 @@ def is_keyword(keywordCandidate):
     else:
         return True
 
+keyword_runners = KeywordCache()
+
+def run_inline_keyword(text):
+    """
+    Runs text as inline keyword. Returns (True, result of the keyword), or (False, None) if text is
+    not a keyword. The keyword is resolved only once. Its runner, or the fact that there is no such
+    keyword, is remembered for as long as the imports of the running suite are unchanged.
+    """
+    if not isinstance(text, str):
+        return False, None
+    runner = resolve_inline_keyword(text)
+    if runner is None:
+        # Robot internals not recognised. Take the long way round.
+        if not is_keyword(text):
+            return False, None
+        result = BuiltIn().run_keyword(text)
+        log(f"Inline keyword [{text}] → {result}")
+        return True, result
+    if runner is False:
+        return False, None
+    result = _run_runner(text, runner)
+    log(f"Inline keyword [{text}] → {result}")
+    return True, result
+
+def resolve_inline_keyword(text):
+    """
+    Returns the runner for the keyword named text, like _resolve_runner. The outcome is remembered
+    for as long as the imports of the running suite are unchanged. Texts already known not to be a
+    keyword are not resolved again.
+    """
+    runner = keyword_runners.get(text)
+    if runner is None and keyword_cache.get(text) is False:
+        runner = False
+        keyword_runners.set(text, runner)
+    if runner is None:
+        runner = _resolve_runner(text)
+        if runner is not None:
+            keyword_runners.set(text, runner)
+            keyword_cache.set(text, runner is not False)
+    return runner
+
+@profiled("keyword detection")
+def _resolve_runner(text):
+    """
+    Returns Robot's runner for the keyword named text, False if there is no such keyword, or None
+    if Robot is not running or its internals are not recognised.
+    """
+    context = EXECUTION_CONTEXTS.current
+    if context is None or not hasattr(context, 'paused_timeouts'):
+        return None
+    if not keyword_index.might_be_keyword(text):
+        return False
+    try:
+        runner = context.namespace.get_runner(text, recommend_on_failure=False)
+        error = runner.keyword.error
+    except AttributeError:
+        return None
+    if error and "multiple keywords" not in error.lower():
+        return False
+    # Running an ambiguous name reports the same error as Robot's Run Keyword would
+    return runner
+
+def _run_runner(name, runner):
+    """Runs a resolved keyword the same way as Robot's Run Keyword does, but without resolving it."""
+    context = EXECUTION_CONTEXTS.current
+    if context.steps:
+        data, result, _ = context.steps[-1]
+        lineno = data.lineno
+    else: # Called when no keyword started, e.g. from a listener
+        data = lineno = None
+        if context.test:
+            result = context.test
+        elif not context.suite.has_tests:
+            result = context.suite.setup
+        else:
+            result = context.suite.teardown
+    kw = Keyword(name, parent=data, lineno=lineno)
+    with context.paused_timeouts:
+        if context.dry_run:
+            return runner.dry_run(kw, result.body.create_keyword(), context)
+        return runner.run(kw, result.body.create_keyword(), context)
+
 def evaluate_keyword_args(*args, **kwargs):
     converted_list = list()
     for arg in args:
-        if is_keyword(arg):
-            BuiltIn().log("Evaluating argument as keyword [%s]" % arg)
-            converted_list.append(BuiltIn().run_keyword(arg))
-            BuiltIn().log("%s → %s" % (arg, converted_list[-1]))
-        else:
-            converted_list.append(arg)
+        is_inline, result = run_inline_keyword(arg)
+        converted_list.append(result if is_inline else arg)
 
     converted_dict = dict()
     for k, v in kwargs.items():
-        if is_keyword(v):
-            BuiltIn().log("Evaluating argument as keyword [%s]" % v)
-            converted_dict[k] = BuiltIn().run_keyword(v)
-            BuiltIn().log("%s = %s → %s" % (k, v, converted_dict[k]))
-        else:
-            converted_dict[k] = v
+        is_inline, result = run_inline_keyword(v)
+        converted_dict[k] = result if is_inline else v
 
     return converted_list, converted_dict
 
@@ -101,11 +321,9 @@ class InlineKeywordConverter(TypeConverter):
         self.type_name = f"keyword returning {type_name(self.type_info.nested[0].type)}"
 
     def _convert(self, value):
-        if not is_keyword(value):
+        is_inline, result = run_inline_keyword(value)
+        if not is_inline:
             raise ValueError
-        BuiltIn().log(f"Evaluating argument as keyword [{value}]")
-        result = BuiltIn().run_keyword(value)
-        BuiltIn().log(f"{value} → {result}")
         if self.converter:
             # Convert the return type of the keyword to the expected type
             try:
@@ -120,11 +338,14 @@ class InlineKeywordConverter(TypeConverter):
 def keyword(name=None, tags=(), types=()):
     def decorator(func):
         for var, type_ in func.__annotations__.items():
+            # The plain type goes first. Values valid for the type are never taken for keywords
+            # and keyword names only add a failed conversion before their cached runner is used.
             func.__annotations__[var] = Union[type_, InlineKeyword[type_]]
         @robot_keyword(name, tags, types)
         @wraps(func)
         def wrapped(*args, **kwargs):
             converted_args, converted_kwargs = evaluate_keyword_args(*args, **kwargs)
             return func(*converted_args, **converted_kwargs)
+        wrapped.robotnl_inline_keywords = True
         return wrapped
     return decorator
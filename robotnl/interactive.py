@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, J. Foederer
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import secs_to_timestr
+
+import socket
+import sys
+from bisect import bisect_left
+
+from .inline_keywords import _current_scope, _same_scope
+
+EXIT_COMMANDS = {"exit", "quit", "stop", "e", "x", "q"}
+COMPLETION_PREFIX = '?'
+MAX_COMPLETIONS = 20
+
+
+def split_keyword_line(line):
+    """
+    Splits a line of keyword input into its cells. Cells are separated by tabs or by two or more
+    spaces, like in Robot's plain text format.
+    """
+    return list(filter(None, [s.strip() for s in line.replace('\t', '  ').split('  ')]))
+
+
+class KeywordNameIndex:
+    """
+    Sorted index of the names of all keywords available in the running suite, for completing and
+    suggesting keyword names while exploring interactively. The index is built once and rebuilt
+    only when the imports of the suite change.
+    """
+    def __init__(self):
+        self.__scope = None
+        self.__names = list() # sorted (lower case name, name)
+
+    def complete(self, prefix):
+        """Returns the names of the keywords starting with prefix, ignoring case"""
+        names = self.__current_names()
+        prefix = prefix.lower()
+        start = bisect_left(names, (prefix,))
+        matches = list()
+        for lowerName, name in names[start:]:
+            if not lowerName.startswith(prefix) or len(matches) >= MAX_COMPLETIONS:
+                break
+            matches.append(name)
+        return matches
+
+    def suggest(self, text):
+        """Returns the names of the keywords containing all words from text, ignoring case"""
+        words = text.lower().split()
+        return [name for lowerName, name in self.__current_names()
+                if all(word in lowerName for word in words)][:MAX_COMPLETIONS]
+
+    def __current_names(self):
+        scope = _current_scope()
+        if scope is None:
+            return list()
+        if not _same_scope(scope, self.__scope):
+            kw_store = scope[0]._kw_store
+            names = set()
+            for owner in (kw_store.suite_file, *kw_store.libraries.values(),
+                          *kw_store.resources.values()):
+                for kw in owner.keywords:
+                    names.add(kw.name)
+                    if owner is not kw_store.suite_file:
+                        names.add(f"{owner.name}.{kw.name}")
+            self.__names = sorted((name.lower(), name) for name in names)
+            self.__scope = scope
+        return self.__names
+
+keyword_names = KeywordNameIndex()
+
+
+class KeywordScript:
+    """
+    Runs keyword input line by line and streams the outcome of each line to ``output``, a function
+    taking a single text argument. Failing keywords are reported, but do not stop the script.
+
+    Besides keywords, a script can contain:
+    - blank lines, which run the previous keyword without waiting for more lines
+    - lines starting with ``#``, which are ignored
+    - lines starting with ``...``, which continue the arguments of the previous keyword
+    - lines starting with ``?``, which list the keyword names starting with the text that follows
+    - one of the exit commands, which ends the script
+    """
+    def __init__(self, output):
+        self.output = output
+        self.executed = 0
+        self.failed = 0
+        self.exited = False
+        self.__pending = None
+
+    def feed(self, line):
+        """
+        Processes the next line of input. Keywords are run as soon as it is clear that the next line
+        does not continue their arguments. Returns False once the script has exited.
+        """
+        cells = split_keyword_line(line)
+        if not cells:
+            self.flush() # A blank line need not wait for the next line to run the keyword
+            return not self.exited
+        if self.exited or cells[0].startswith('#'):
+            return not self.exited
+        if cells[0] == '...' and self.__pending:
+            self.__pending += cells[1:]
+            return True
+        self.flush()
+        if len(cells) == 1 and cells[0].lower() in EXIT_COMMANDS:
+            self.exited = True
+        elif cells[0].startswith(COMPLETION_PREFIX):
+            self.__complete(line.strip()[len(COMPLETION_PREFIX):].strip())
+        else:
+            self.__pending = cells
+        return not self.exited
+
+    def flush(self):
+        """Runs the keyword that is still waiting for possible continuation lines"""
+        if self.__pending:
+            cells, self.__pending = self.__pending, None
+            self.__run(cells[0], cells[1:])
+
+    def run(self, lines):
+        """Processes all lines as a single script. Returns False if the script exited."""
+        for line in lines:
+            if not self.feed(line):
+                break
+        self.flush()
+        self.output(f"Script done: {self.executed} keywords executed, {self.failed} failed")
+        return not self.exited
+
+    def __run(self, name, args):
+        s_Input = "    ".join([name, *args])
+        self.executed += 1
+        try:
+            return_value = BuiltIn().run_keyword(name, *args)
+        except Exception as e:
+            self.failed += 1
+            self.output(f"FAIL  {s_Input}\n      {e}")
+        else:
+            if return_value is None:
+                self.output(f"PASS  {s_Input}")
+            else:
+                self.output(f"PASS  {s_Input}\n      → {return_value}")
+
+    def __complete(self, text):
+        names = keyword_names.complete(text) or keyword_names.suggest(text)
+        self.output("\n".join(names) if names else f"No keywords matching '{text}'")
+
+
+def run_script_from(source, output, timeout=300):
+    """
+    Runs a keyword script from source: 'stdin', 'localhost:<port>' or a file path. From a socket,
+    lines are run as they arrive and results are sent back over the same connection, until the
+    client closes the connection or sends an exit command. Fails if no client connects within
+    timeout seconds.
+    """
+    if source.lower() == 'stdin':
+        return KeywordScript(output).run(sys.__stdin__)
+
+    if source.lower().startswith('localhost:'):
+        port = int(source.split(':', 1)[1])
+        with socket.create_server(('127.0.0.1', port)) as server:
+            output(f"Waiting for keyword script on {source}")
+            server.settimeout(timeout)
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                BuiltIn().fail(f"No keyword script received on {source}: no connection within "
+                               f"{secs_to_timestr(timeout)}")
+            connection.settimeout(None)
+        with connection, connection.makefile('r', encoding='utf-8') as lines:
+            def stream(text):
+                output(text)
+                connection.sendall((text + "\n").encode('utf-8'))
+            return KeywordScript(stream).run(lines)
+
+    with open(source, encoding='utf-8') as lines:
+        return KeywordScript(output).run(lines)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, J. Foederer
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+
+from robot.api import SuiteVisitor
+from robot.running import EXECUTION_CONTEXTS
+from robot.utils import normalize
+from robot.variables import contains_variable
+
+from .check_plan import CheckPlan
+from .inline_keywords import is_keyword, resolve_inline_keyword
+
+CHECK_KEYWORDS = {'checkthat': "Requirement",
+                  'checkprecondition': "Precondition",
+                  'checkpostcondition': "Postcondition"}
+BDD_PREFIXES = ('given', 'when', 'then', 'and', 'but')
+
+
+class PreResolver:
+    """
+    Robot listener that prepares robotnl before a suite starts running.
+
+    The suite's test cases and keywords are scanned for check keywords and for keywords that accept
+    inline keywords. For all their arguments it is looked up whether they are keywords, and for
+    inline keywords also how to run them, so that these lookups are done in one go and can be
+    served from cache while the suite runs.
+
+    Usage:
+    | robot --listener robotnl.PreResolver tests/
+
+    Adding the ``report`` argument prints the check plans to the console as well. The same report
+    can be generated without running any tests using:
+    | python -m robotnl.preresolver tests/
+    """
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, mode=None):
+        self.report = str(mode).lower() == 'report'
+
+    def start_suite(self, data, result):
+        context = EXECUTION_CONTEXTS.current
+        if context is None:
+            return
+        collector = _StepCollector(context.namespace)
+        for test in data.tests:
+            test.visit(collector)
+        for fixture in (data.setup, data.teardown):
+            if fixture:
+                fixture.visit(collector)
+        for resource in collector.resources(data.resource):
+            for user_keyword in resource.keywords:
+                user_keyword.body.visit(collector)
+
+        for candidate in collector.candidates:
+            is_keyword(candidate)
+        for candidate in collector.inlineCandidates:
+            resolve_inline_keyword(candidate)
+        if self.report:
+            self.__report(data, collector.checks)
+
+    @staticmethod
+    def __report(suite, checks):
+        print(f"\n{suite.full_name}", file=sys.__stdout__)
+        for step, plan in checks:
+            print(f"  {step.source}:{step.lineno}: {plan}", file=sys.__stdout__)
+
+
+class _StepCollector(SuiteVisitor):
+    """
+    Collects check steps and the arguments that are candidates for being a keyword or an inline
+    keyword. Check steps are parsed into check plans the same way as when they run, which looks
+    up their arguments as keywords right away.
+    """
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.checks = list() # (step, check plan, or the reason why the check is invalid)
+        self.candidates = dict() # used as ordered set
+        self.inlineCandidates = dict() # used as ordered set
+        self.__inline_support = dict()
+
+    def resources(self, suite_resource):
+        try:
+            return [suite_resource, *self.namespace._kw_store.resources.values()]
+        except AttributeError:
+            return [suite_resource]
+
+    def start_keyword(self, keyword):
+        name = keyword.name or ""
+        checkType = CHECK_KEYWORDS.get(self.__normalize_check_name(name))
+        if checkType:
+            try:
+                plan = CheckPlan(checkType, keyword.args)
+            except AssertionError as error:
+                plan = f"{checkType} check is invalid: {error}"
+            else:
+                self.candidates.update(dict.fromkeys(self.__operands(plan)))
+            self.checks.append((keyword, plan))
+        elif self.__supports_inline_keywords(name):
+            for arg in keyword.args:
+                if contains_variable(arg):
+                    continue # Variables are already replaced when inline keywords are evaluated
+                if '=' in arg:
+                    # Could be a named argument. Including the full text as well does no harm.
+                    self.inlineCandidates[arg.split('=', 1)[1]] = None
+                self.inlineCandidates[arg] = None
+
+    @staticmethod
+    def __operands(plan):
+        """Yields the texts that are looked up as keywords when the plan's operands are evaluated"""
+        if plan.timeConstraint:
+            yield plan.timeConstraint
+        while plan:
+            for operand in (plan.leftOperand, plan.rightOperand):
+                if operand:
+                    yield operand[0]
+            plan = plan.guard
+
+    @staticmethod
+    def __normalize_check_name(name):
+        name = normalize(name, ignore='_')
+        if name.startswith('robotnl.'):
+            name = name[len('robotnl.'):]
+        for prefix in BDD_PREFIXES:
+            if name.startswith(prefix) and name[len(prefix):] in CHECK_KEYWORDS:
+                return name[len(prefix):]
+        return name
+
+    def __supports_inline_keywords(self, name):
+        if name not in self.__inline_support:
+            try:
+                method = self.namespace.get_runner(name, recommend_on_failure=False).keyword.method
+                self.__inline_support[name] = getattr(method, 'robotnl_inline_keywords', False)
+            except Exception:
+                self.__inline_support[name] = False
+        return self.__inline_support[name]
+
+
+if __name__ == '__main__':
+    import robot
+    sys.exit(robot.run_cli(['--dryrun', '--output', 'NONE', '--report', 'NONE', '--log', 'NONE',
+                            '--listener', 'robotnl.preresolver.PreResolver:report']
+                           + sys.argv[1:], exit=False))
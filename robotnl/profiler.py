@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, J. Foederer
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from robot.libraries.BuiltIn import BuiltIn
+
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+_active = None # The profiler of the running test run, if any
+_log_output = ContextVar('robotnl_log_output', default=None) # Replaces Robot's log, if set
+
+
+def profiled(category, kind='robotnl'):
+    """
+    Decorator attributing the time spent in the decorated function to a category of robotnl's own
+    machinery, or with kind 'waiting', to time that robotnl spends waiting. Without an active
+    profiler, only the check for an active profiler is added.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            _active.push(f"[{category}]", kind)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _active.pop()
+        return wrapper
+    return decorator
+
+@profiled("logging")
+def log(message, level='INFO'):
+    output = _log_output.get()
+    if output is None:
+        BuiltIn().log(message, level=level)
+    else:
+        output(message, level)
+
+@contextmanager
+def logging_to(output):
+    """
+    Sends robotnl's log messages to output, a function taking the message and its level, instead
+    of to Robot's log, for as long as the context lasts.
+    """
+    token = _log_output.set(output)
+    try:
+        yield
+    finally:
+        _log_output.reset(token)
+
+
+class Profiler:
+    """
+    Robot listener that measures where the time of a test run goes: to robotnl's machinery or to
+    the keywords it runs.
+
+    Time is measured per suite, test and keyword. Within robotnl's keywords, the time spent on
+    keyword detection, check parsing and compilation, operator conversion, logging and polling
+    sleeps is measured as separate categories, shown in square brackets. Check keywords include their arguments in
+    their name, so that each check can be told apart.
+
+    At the end of the run, the time spent in each stack of suites, tests, keywords and categories
+    is written to a file in collapsed stack format, the input format of flame graph tools. A
+    relative path for this file is taken relative to Robot's output directory. The top N of
+    keywords and categories taking most of the time is printed to the console, with each check
+    and the categories of each check listed separately.
+
+    Usage:
+    | robot --listener robotnl.Profiler tests/
+    | robot --listener robotnl.Profiler:profile.folded:20 tests/
+    """
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, output='robotnl_profile.folded', top=10):
+        self.output = output
+        self.top = int(top)
+        self.__stack = list() # [name, kind, start time, time spent in children]
+        self.__self_times = defaultdict(float) # stack of names → seconds
+        self.__kinds = dict() # stack of names → 'robotnl', 'waiting', 'keyword' or 'robot'
+
+    def push(self, name, kind='robotnl'):
+        self.__stack.append([name.replace(';', ','), kind, time.perf_counter(), 0.0])
+
+    def pop(self):
+        name, kind, start, childTime = self.__stack.pop()
+        elapsed = time.perf_counter() - start
+        stack = (*[frame[0] for frame in self.__stack], name)
+        self.__self_times[stack] += elapsed - childTime
+        self.__kinds[stack] = kind
+        if self.__stack:
+            self.__stack[-1][3] += elapsed
+
+    def start_suite(self, data, result):
+        global _active
+        if _active is not self:
+            _active = self
+            outputDir = BuiltIn().get_variable_value('${OUTPUT DIR}')
+            if outputDir:
+                self.output = os.path.join(outputDir, self.output)
+        self.push(data.name, 'robot')
+
+    def end_suite(self, data, result):
+        self.pop()
+
+    def start_test(self, data, result):
+        self.push(data.name, 'robot')
+
+    def end_test(self, data, result):
+        self.pop()
+
+    def start_keyword(self, data, result):
+        name = result.full_name
+        if result.owner == 'robotnl':
+            if name.lower().startswith('robotnl.check') and data.args:
+                name += " | " + "  ".join(str(arg) for arg in data.args)
+            self.push(name, 'robotnl')
+        else:
+            self.push(name, 'keyword')
+
+    def end_keyword(self, data, result):
+        self.pop()
+
+    def close(self):
+        global _active
+        if _active is self:
+            _active = None
+        with open(self.output, 'w', encoding='utf-8') as f:
+            for stack, seconds in self.__self_times.items():
+                f.write(f"{';'.join(stack)} {round(seconds * 1e6)}\n")
+        self.__report()
+
+    def __report(self):
+        totals = defaultdict(float) # keyword or category → seconds
+        kindTotals = defaultdict(float)
+        for stack, seconds in self.__self_times.items():
+            kind = self.__kinds[stack]
+            kindTotals[kind] += seconds
+            if kind != 'robot':
+                totals[self.__summary_name(stack)] += seconds
+        print(f"\nrobotnl profile: {kindTotals['robotnl']:.3f}s in robotnl, "
+              f"{kindTotals['waiting']:.3f}s waiting between polls, "
+              f"{kindTotals['keyword']:.3f}s in other keywords, "
+              f"{kindTotals['robot']:.3f}s in Robot itself", file=sys.__stdout__)
+        print(f"Stacks written to {self.output}. Top {self.top}:", file=sys.__stdout__)
+        for name, seconds in sorted(totals.items(), key=lambda item: -item[1])[:self.top]:
+            print(f"{seconds:10.3f}s  {name}", file=sys.__stdout__)
+
+    @staticmethod
+    def __summary_name(stack):
+        """
+        Name under which the time of the stack is summarized: its keyword, including the arguments
+        of checks, or its category together with the check it was spent on, if any.
+        """
+        name = stack[-1]
+        if name.startswith('['):
+            check = next((frame for frame in reversed(stack[:-1]) if " | " in frame), None)
+            if check:
+                name = f"{check} {name}"
+        return name
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, J. Foederer
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+
+MIN_EVICTION_SIZE = 100 # Number of stored samples at which expired samples are first evicted
+
+
+class _Flight:
+    """A sample that is being taken"""
+    def __init__(self):
+        self.thread = threading.get_ident()
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SharedSamples:
+    """
+    Shares samples of operand keywords between checks. When a keyword with the same arguments is
+    already being evaluated, the result of that evaluation is awaited instead of starting another
+    one. When its last result is younger than max_age seconds, that result is reused. With a
+    max_age of 0, only results of evaluations in flight are shared. Expired results are evicted
+    as the number of stored results grows.
+
+    Time is read from ``clock``, a function returning the current time in seconds.
+    """
+    def __init__(self, clock, maxAge=0.0):
+        self.clock = clock
+        self.maxAge = maxAge
+        self.evaluations = 0
+        self.reusedFresh = 0
+        self.reusedInFlight = 0
+        self.__lock = threading.Lock()
+        self.__samples = dict() # key → (time at start of evaluation, value)
+        self.__in_flight = dict() # key → _Flight
+        self.__eviction_size = MIN_EVICTION_SIZE
+
+    def sample(self, key, evaluate):
+        """Returns the shared sample for key, calling evaluate() when there is none to share"""
+        with self.__lock:
+            now = self.clock()
+            sample = self.__samples.get(key)
+            if sample is not None and now - sample[0] < self.maxAge:
+                self.reusedFresh += 1
+                return sample[1]
+            flight = self.__in_flight.get(key)
+            if flight is None or flight.thread == threading.get_ident():
+                # Either no evaluation is in flight, or it is this thread's own, nested one
+                flight = _Flight()
+                self.__in_flight[key] = flight
+                self.evaluations += 1
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            with self.__lock:
+                self.reusedInFlight += 1
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = evaluate()
+        except BaseException as error:
+            flight.error = error
+            raise
+        else:
+            if self.maxAge > 0:
+                with self.__lock:
+                    self.__samples[key] = (now, flight.value)
+                    if len(self.__samples) >= self.__eviction_size:
+                        self.__evict_expired(self.clock())
+        finally:
+            with self.__lock:
+                if self.__in_flight.get(key) is flight:
+                    del self.__in_flight[key]
+            flight.done.set()
+        return flight.value
+
+    def __evict_expired(self, now):
+        for key in [key for key, (sampleTime, _) in self.__samples.items()
+                    if now - sampleTime >= self.maxAge]:
+            del self.__samples[key]
+        self.__eviction_size = max(MIN_EVICTION_SIZE, 2 * len(self.__samples))
+
+    def statistics(self):
+        return {'evaluations': self.evaluations,
+                'reused fresh': self.reusedFresh,
+                'reused in flight': self.reusedInFlight}
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, J. Foederer
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import atexit
+import json
+import math
+import os
+
+from .profiler import log
+
+
+class TimingProfile:
+    """
+    Records how long timed checks take to pass, keyed by the text of the check. As the moment a
+    check became true lies somewhere between its last failing and its first passing evaluation,
+    the start of its last failing evaluation is recorded. For checks with a known history, the
+    expected window in which the check passes can be requested, so that polling can be
+    concentrated around that moment.
+    """
+    MAX_SAMPLES = 50 # Only recent history is relevant. Also keeps the file size in check.
+    MIN_SAMPLES = 3  # Too little history is more likely to mislead than to help
+
+    def __init__(self, path=None):
+        self.path = path
+        self.__samples = dict()
+        self.__dirty = False
+        if path:
+            if os.path.exists(path):
+                try:
+                    with open(path, encoding='utf-8') as f:
+                        self.__samples = json.load(f)
+                except ValueError as e:
+                    log(f"Ignoring unreadable timing profile '{path}': {e}", level='WARN')
+            atexit.register(self.save)
+
+    def __len__(self):
+        return len(self.__samples)
+
+    def record(self, checkText, secondsToPass):
+        samples = self.__samples.setdefault(checkText, [])
+        samples.append(round(secondsToPass, 3))
+        del samples[:-self.MAX_SAMPLES]
+        self.__dirty = True
+
+    def expected_window(self, checkText):
+        """
+        Returns the (earliest, latest) number of seconds in which the check is expected to pass,
+        based on the 10th and 90th percentile of its history. Returns None if there is not enough
+        history available.
+        """
+        samples = sorted(self.__samples.get(checkText, []))
+        if len(samples) < self.MIN_SAMPLES:
+            return None
+        return samples[len(samples)//10], samples[math.ceil(len(samples)*0.9)-1]
+
+    def reset(self, checkText=None):
+        if checkText is None:
+            self.__samples.clear()
+        else:
+            self.__samples.pop(checkText, None)
+        self.__dirty = True
+
+    def close(self):
+        """
+        Saves the profile to its own file and stops it from being saved again when Python exits,
+        for when the profile is replaced by another one.
+        """
+        self.save()
+        atexit.unregister(self.save)
+
+    def save(self, path=None):
+        """
+        Writes the profile to path, or to its own file if no path is given. The file is replaced
+        as a whole, so that an interrupted write cannot leave a corrupt profile behind.
+        """
+        if path is None:
+            if not self.path or not self.__dirty:
+                return
+            path = self.path
+        tmpPath = path + '.tmp'
+        with open(tmpPath, 'w', encoding='utf-8') as f:
+            json.dump(self.__samples, f, ensure_ascii=False, indent=1)
+        os.replace(tmpPath, path)
+        if path == self.path:
+            self.__dirty = False
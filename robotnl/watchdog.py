@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2026, J. Foederer
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from robot.api import logger
+from robot.running import EXECUTION_CONTEXTS
+
+MAX_REPORTED_VIOLATIONS = 10
+
+
+class Watchdog:
+    """
+    A check that is sampled in the background of a test, on its own schedule. Samples that are
+    not true are recorded as violations, with the time since the watchdog started.
+    """
+    def __init__(self, name, plan, interval, startTime, suite, test):
+        self.name = name
+        self.plan = plan
+        self.interval = interval
+        self.startTime = startTime
+        self.nextSample = startTime
+        self.suite = suite # Suite the watchdog was started in
+        self.test = test # Test the watchdog was started in, None when started outside a test
+        self.samples = 0
+        self.violations = list() # (seconds since start, evaluated expression)
+        self.reported = 0 # Number of violations already reported to a test
+
+    def new_violations(self):
+        """Returns the violations not reported before, and marks them as reported"""
+        violations = self.violations[self.reported:]
+        self.reported = len(self.violations)
+        return violations
+
+    def report(self, violations=None):
+        """Describes the violations, by default all of them, in a bounded report"""
+        violations = self.violations if violations is None else violations
+        lines = [f"Watchdog '{self.name}' found {len(violations)} violations "
+                 f"in {self.samples} samples of {self.plan.expression()}:"]
+        lines += [f"{seconds:9.3f}s {expression}"
+                  for seconds, expression in violations[:MAX_REPORTED_VIOLATIONS]]
+        if len(violations) > MAX_REPORTED_VIOLATIONS:
+            lines.append("...")
+        return "\n".join(lines)
+
+
+class Watchdogs:
+    """
+    Keeps the running watchdogs and samples them. Robot keywords can only be run safely from
+    Robot's own thread, so instead of a worker thread, this library listener samples the watchdogs
+    that are due whenever a keyword ends. The test flow itself is not held up between samples.
+
+    Watchdogs started in a test end with that test, those started in a suite setup end with that
+    suite. Violations fail the test in which they were found, unless the watchdog is stopped
+    before the test ends. Violations found after the last test of a suite are reported as errors
+    when the suite ends.
+    """
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, evaluate, clock):
+        """
+        evaluate: function taking a check plan, returning "passed" or "failed" and the evaluated
+                  expression, like RobotChecks' evaluation of a check
+        clock:    function returning the current time in seconds
+        """
+        self.evaluate = evaluate
+        self.clock = clock
+        self.__running = dict()
+        self.__sampling = False
+
+    def start(self, name, plan, interval):
+        if name in self.__running:
+            raise ValueError(f"Watchdog '{name}' is already running")
+        context = EXECUTION_CONTEXTS.current
+        suite = context.suite if context else None
+        test = context.test if context else None
+        watchdog = Watchdog(name, plan, interval, self.clock(), suite, test)
+        self.__running[name] = watchdog
+        self.__sample(watchdog)
+        return watchdog
+
+    def stop(self, name):
+        watchdog = self.__running.pop(name, None)
+        if watchdog is None:
+            raise ValueError(f"No watchdog named '{name}' is running")
+        self.__sample(watchdog)
+        return watchdog
+
+    def end_keyword(self, data, result):
+        if not self.__running or self.__sampling:
+            return
+        now = self.clock()
+        for watchdog in list(self.__running.values()):
+            if now >= watchdog.nextSample:
+                self.__sample(watchdog)
+
+    def end_test(self, data, result):
+        context = EXECUTION_CONTEXTS.current
+        test = context.test if context else None
+        failures = list()
+        for name, watchdog in list(self.__running.items()):
+            if watchdog.test is not None and watchdog.test is test:
+                del self.__running[name]
+            newViolations = watchdog.new_violations()
+            if newViolations:
+                failures.append(watchdog.report(newViolations))
+        if failures:
+            result.status = 'FAIL'
+            result.message = "\n\n".join([result.message, *failures] if result.message
+                                         else failures)
+
+    def end_suite(self, data, result):
+        context = EXECUTION_CONTEXTS.current
+        suite = context.suite if context else None
+        for name, watchdog in list(self.__running.items()):
+            if watchdog.suite is not suite:
+                continue
+            del self.__running[name]
+            self.__sample(watchdog)
+            newViolations = watchdog.new_violations()
+            if newViolations:
+                report = watchdog.report(newViolations)
+                logger.error(report)
+                result.message = f"{result.message}\n\n{report}" if result.message else report
+            else:
+                logger.info(f"Watchdog '{name}' stopped at the end of suite '{data.name}' "
+                            f"without violations in {watchdog.samples} samples")
+
+    def __sample(self, watchdog):
+        self.__sampling = True
+        try:
+            sampleTime = self.clock()
+            try:
+                passed, s_Expression = self.evaluate(watchdog.plan)
+            except Exception as error:
+                passed, s_Expression = "failed", f"{watchdog.plan.expression()}: {error}"
+            watchdog.samples += 1
+            if passed != "passed":
+                watchdog.violations.append((sampleTime - watchdog.startTime, s_Expression))
+            watchdog.nextSample = sampleTime + watchdog.interval
+        finally:
+            self.__sampling = False